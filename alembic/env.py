@@ -7,12 +7,15 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 from app.core.config import settings
-from app.core.database import Base
+from app.core.database import Base, connect_args
 
 # Import all models to ensure they are registered with Base.metadata
 from app.models.account import Account
+from app.models.hold import Hold
 from app.models.ledger_entry import LedgerEntry
+from app.models.rollup import AccountDailyRollup, AccountMonthlyRollup
 from app.models.transaction import Transaction
+from app.models.transfer import CrossShardTransfer
 
 config = context.config
 
@@ -44,20 +47,24 @@ def do_run_migrations(connection: Connection) -> None:
 
 
 async def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
-    configuration = config.get_section(config.config_ini_section)
-    configuration["sqlalchemy.url"] = settings.DATABASE_URL
-
-    connectable = async_engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
-
-    async with connectable.connect() as connection:
-        await connection.run_sync(do_run_migrations)
-
-    await connectable.dispose()
+    """Run migrations in 'online' mode, against every shard."""
+    # Callers can target other databases, e.g. the query-plan test tier
+    urls = config.attributes.get("database_urls") or settings.SHARD_DATABASE_URLS
+    for url in urls:
+        configuration = config.get_section(config.config_ini_section)
+        configuration["sqlalchemy.url"] = url
+
+        connectable = async_engine_from_config(
+            configuration,
+            prefix="sqlalchemy.",
+            poolclass=pool.NullPool,
+            connect_args=connect_args(),
+        )
+
+        async with connectable.connect() as connection:
+            await connection.run_sync(do_run_migrations)
+
+        await connectable.dispose()
 
 
 if context.is_offline_mode():
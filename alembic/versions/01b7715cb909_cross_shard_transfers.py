@@ -0,0 +1,61 @@
+"""Cross-shard transfers
+
+Revision ID: 01b7715cb909
+Revises: 82c884ea1dd4
+Create Date: 2026-10-19 13:41:05.672390
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "01b7715cb909"
+down_revision: Union[str, None] = "82c884ea1dd4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cross_shard_transfers",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("transaction_id", sa.UUID(), nullable=False),
+        sa.Column("sender_id", sa.UUID(), nullable=False),
+        sa.Column("receiver_id", sa.UUID(), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column("reference", sa.String(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "COMPLETED", "FAILED", name="transferstatus"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["sender_id"], ["accounts.id"]),
+        sa.ForeignKeyConstraint(["transaction_id"], ["transactions.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("transaction_id"),
+    )
+    op.create_index(
+        "ix_cross_shard_transfers_pending",
+        "cross_shard_transfers",
+        ["created_at"],
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_cross_shard_transfers_pending", table_name="cross_shard_transfers"
+    )
+    op.drop_table("cross_shard_transfers")
+    sa.Enum(name="transferstatus").drop(op.get_bind())
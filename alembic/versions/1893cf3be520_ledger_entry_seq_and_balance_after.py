@@ -0,0 +1,128 @@
+"""Per-account entry seq and running balance
+
+Revision ID: 1893cf3be520
+Revises: 3bf9051af3c6
+Create Date: 2026-10-19 09:12:44.518203
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1893cf3be520"
+down_revision: Union[str, None] = "3bf9051af3c6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Accounts backfilled per statement. Each chunk commits on its own so the
+# backfill never holds locks on the whole of ledger_entries at once.
+BACKFILL_CHUNK_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column(
+        "accounts",
+        sa.Column(
+            "last_entry_seq", sa.BigInteger(), server_default="0", nullable=False
+        ),
+    )
+    op.add_column("ledger_entries", sa.Column("seq", sa.BigInteger(), nullable=True))
+    op.add_column(
+        "ledger_entries",
+        sa.Column("balance_after", sa.Numeric(precision=20, scale=2), nullable=True),
+    )
+
+    with op.get_context().autocommit_block():
+        # Scaffolding so each chunk reads only its own accounts' entries; the
+        # real (account_id, seq) index needs seq filled in first.
+        op.create_index(
+            "ix_ledger_entries_account_id_backfill",
+            "ledger_entries",
+            ["account_id"],
+            postgresql_concurrently=True,
+        )
+        conn = op.get_bind()
+        last_id = None
+        while True:
+            if last_id is None:
+                rows = conn.execute(
+                    sa.text("SELECT id FROM accounts ORDER BY id LIMIT :n"),
+                    {"n": BACKFILL_CHUNK_SIZE},
+                )
+            else:
+                rows = conn.execute(
+                    sa.text(
+                        "SELECT id FROM accounts WHERE id > :last_id ORDER BY id LIMIT :n"
+                    ),
+                    {"last_id": last_id, "n": BACKFILL_CHUNK_SIZE},
+                )
+            ids = [row[0] for row in rows]
+            if not ids:
+                break
+
+            bounds = {"lo": ids[0], "hi": ids[-1]}
+            # Entries of one transaction share created_at, so id breaks the tie.
+            conn.execute(
+                sa.text(
+                    """
+                    UPDATE ledger_entries AS le
+                    SET seq = numbered.seq, balance_after = numbered.balance_after
+                    FROM (
+                        SELECT
+                            id,
+                            row_number() OVER w AS seq,
+                            sum(amount) OVER (w ROWS UNBOUNDED PRECEDING) AS balance_after
+                        FROM ledger_entries
+                        WHERE account_id BETWEEN :lo AND :hi
+                        WINDOW w AS (PARTITION BY account_id ORDER BY created_at, id)
+                    ) AS numbered
+                    WHERE le.id = numbered.id
+                    """
+                ),
+                bounds,
+            )
+            conn.execute(
+                sa.text(
+                    """
+                    UPDATE accounts AS a
+                    SET last_entry_seq = counts.last_seq
+                    FROM (
+                        SELECT account_id, max(seq) AS last_seq
+                        FROM ledger_entries
+                        WHERE account_id BETWEEN :lo AND :hi
+                        GROUP BY account_id
+                    ) AS counts
+                    WHERE a.id = counts.account_id
+                    """
+                ),
+                bounds,
+            )
+            last_id = ids[-1]
+
+    op.alter_column("ledger_entries", "seq", nullable=False)
+    op.alter_column("ledger_entries", "balance_after", nullable=False)
+    # CONCURRENTLY can't run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_ledger_entries_account_id_seq",
+            "ledger_entries",
+            ["account_id", "seq"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_ledger_entries_account_id_backfill",
+            table_name="ledger_entries",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ledger_entries_account_id_seq", table_name="ledger_entries")
+    op.drop_column("ledger_entries", "balance_after")
+    op.drop_column("ledger_entries", "seq")
+    op.drop_column("accounts", "last_entry_seq")
@@ -0,0 +1,57 @@
+"""Transaction search indexes
+
+Revision ID: 444e14abd8b5
+Revises: 8c51ea96376f
+Create Date: 2026-10-19 18:12:40.583127
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "444e14abd8b5"
+down_revision: Union[str, None] = "8c51ea96376f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_transactions_created_at_id",
+            "transactions",
+            ["created_at", "id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_transactions_reference_created_at_id",
+            "transactions",
+            ["reference", "created_at", "id"],
+            postgresql_ops={"reference": "text_pattern_ops"},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_transactions_unsettled_created_at_id",
+            "transactions",
+            ["created_at", "id"],
+            postgresql_where=sa.text("status <> 'COMPLETED'"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_ledger_entries_transaction_id",
+            "ledger_entries",
+            ["transaction_id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ledger_entries_transaction_id", table_name="ledger_entries")
+    op.drop_index("ix_transactions_unsettled_created_at_id", table_name="transactions")
+    op.drop_index("ix_transactions_reference_created_at_id", table_name="transactions")
+    op.drop_index("ix_transactions_created_at_id", table_name="transactions")
@@ -0,0 +1,70 @@
+"""Authorization holds
+
+Revision ID: 6c20838709d0
+Revises: 01b7715cb909
+Create Date: 2026-10-19 15:27:52.310846
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6c20838709d0"
+down_revision: Union[str, None] = "01b7715cb909"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A constant default is metadata-only on Postgres 11+, so no table rewrite.
+    op.add_column(
+        "accounts",
+        sa.Column(
+            "reserved",
+            sa.Numeric(precision=20, scale=2),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+    op.create_table(
+        "holds",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column("amount", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column("captured_amount", sa.Numeric(precision=20, scale=2), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("ACTIVE", "CAPTURED", "RELEASED", "EXPIRED", name="holdstatus"),
+            nullable=False,
+        ),
+        sa.Column("reference", sa.String(), nullable=True),
+        sa.Column("transaction_id", sa.UUID(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["account_id"], ["accounts.id"]),
+        sa.ForeignKeyConstraint(["transaction_id"], ["transactions.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_holds_active_expires_at",
+        "holds",
+        ["expires_at"],
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_holds_active_expires_at", table_name="holds")
+    op.drop_table("holds")
+    sa.Enum(name="holdstatus").drop(op.get_bind())
+    op.drop_column("accounts", "reserved")
@@ -0,0 +1,43 @@
+"""Account listing indexes
+
+Revision ID: 82c884ea1dd4
+Revises: 1893cf3be520
+Create Date: 2026-10-19 10:03:17.940251
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "82c884ea1dd4"
+down_revision: Union[str, None] = "1893cf3be520"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_accounts_currency_id",
+            "accounts",
+            ["currency", "id"],
+            postgresql_concurrently=True,
+        )
+        # Name-prefix pages are ordered by (name, id) in the C collation, so the
+        # LIKE range and the page order come off the same index.
+        op.create_index(
+            "ix_accounts_name_id",
+            "accounts",
+            [sa.text('name COLLATE "C"'), "id"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_accounts_name_id", table_name="accounts")
+    op.drop_index("ix_accounts_currency_id", table_name="accounts")
@@ -0,0 +1,107 @@
+"""Account activity rollups
+
+Revision ID: 8c51ea96376f
+Revises: 6c20838709d0
+Create Date: 2026-10-19 16:48:09.125733
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c51ea96376f"
+down_revision: Union[str, None] = "6c20838709d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Accounts backfilled per statement, each chunk committed on its own
+BACKFILL_CHUNK_SIZE = 1000
+
+ROLLUP_PERIODS = {
+    "account_daily_rollups": ("day", "(created_at AT TIME ZONE 'UTC')::date"),
+    "account_monthly_rollups": (
+        "month",
+        "date_trunc('month', created_at AT TIME ZONE 'UTC')::date",
+    ),
+}
+
+
+def _create_rollup_table(name: str, period: str) -> None:
+    op.create_table(
+        name,
+        sa.Column("account_id", sa.UUID(), nullable=False),
+        sa.Column(period, sa.Date(), nullable=False),
+        sa.Column("credits", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column("debits", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False),
+        sa.Column("closing_balance", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.Column("last_seq", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("account_id", period),
+    )
+
+
+def upgrade() -> None:
+    for name, (period, _) in ROLLUP_PERIODS.items():
+        _create_rollup_table(name, period)
+
+    # Runs before the app starts serving, so nothing else writes the rollups yet;
+    # from then on each posting maintains them in its own transaction.
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        last_id = None
+        while True:
+            if last_id is None:
+                rows = conn.execute(
+                    sa.text("SELECT id FROM accounts ORDER BY id LIMIT :n"),
+                    {"n": BACKFILL_CHUNK_SIZE},
+                )
+            else:
+                rows = conn.execute(
+                    sa.text(
+                        "SELECT id FROM accounts WHERE id > :last_id ORDER BY id LIMIT :n"
+                    ),
+                    {"last_id": last_id, "n": BACKFILL_CHUNK_SIZE},
+                )
+            ids = [row[0] for row in rows]
+            if not ids:
+                break
+
+            for name, (period, period_expr) in ROLLUP_PERIODS.items():
+                conn.execute(
+                    sa.text(
+                        f"""
+                        INSERT INTO {name} AS r
+                            (account_id, {period}, credits, debits, entry_count,
+                             closing_balance, last_seq)
+                        SELECT account_id,
+                               {period_expr},
+                               coalesce(sum(amount) FILTER (WHERE amount > 0), 0),
+                               coalesce(-sum(amount) FILTER (WHERE amount < 0), 0),
+                               count(*),
+                               (array_agg(balance_after ORDER BY seq DESC))[1],
+                               max(seq)
+                        FROM ledger_entries
+                        WHERE account_id BETWEEN :lo AND :hi
+                        GROUP BY account_id, {period_expr}
+                        ON CONFLICT (account_id, {period}) DO UPDATE SET
+                            credits = r.credits + EXCLUDED.credits,
+                            debits = r.debits + EXCLUDED.debits,
+                            entry_count = r.entry_count + EXCLUDED.entry_count,
+                            closing_balance = CASE
+                                WHEN EXCLUDED.last_seq > r.last_seq
+                                THEN EXCLUDED.closing_balance ELSE r.closing_balance END,
+                            last_seq = greatest(r.last_seq, EXCLUDED.last_seq)
+                        """
+                    ),
+                    {"lo": ids[0], "hi": ids[-1]},
+                )
+            last_id = ids[-1]
+
+
+def downgrade() -> None:
+    for name in ROLLUP_PERIODS:
+        op.drop_table(name)
@@ -1,9 +1,13 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import accounts, transactions
+from app.api.v1.endpoints import accounts, feed, holds, transactions
 
 api_router = APIRouter()
 api_router.include_router(accounts.router, prefix="/accounts", tags=["accounts"])
+api_router.include_router(
+    holds.router, prefix="/accounts/{account_id}/holds", tags=["holds"]
+)
 api_router.include_router(
     transactions.router, prefix="/transactions", tags=["transactions"]
 )
+api_router.include_router(feed.router, prefix="/feed", tags=["feed"])
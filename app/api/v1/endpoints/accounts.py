@@ -1,27 +1,64 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
-from app.core.database import get_db
 from app.core.exceptions import AccountNotFoundException
-from app.schemas.account import Account, AccountCreate
-from app.services.ledger import LedgerService
+from app.schemas.account import Account, AccountCreate, AccountLookup, AccountPage
+from app.schemas.summary import AccountSummary, Granularity
+from app.services.sharded_ledger import ShardedLedgerService, get_ledger
 
 router = APIRouter()
 
 
 @router.post("/", response_model=Account, status_code=status.HTTP_201_CREATED)
-async def create_account(account_in: AccountCreate, db: AsyncSession = Depends(get_db)):
-    service = LedgerService(db)
-    return await service.create_account(account_in)
+async def create_account(
+    account_in: AccountCreate, ledger: ShardedLedgerService = Depends(get_ledger)
+):
+    return await ledger.create_account(account_in)
+
+
+@router.get("/", response_model=AccountPage)
+async def list_accounts(
+    currency: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    min_balance: Optional[Decimal] = None,
+    max_balance: Optional[Decimal] = None,
+    after: Optional[UUID] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    ledger: ShardedLedgerService = Depends(get_ledger),
+):
+    """
+    Pages are ordered by id, or by (name, id) with `name_prefix`; pass
+    `next_cursor` back as `after` for the next page. min_balance/max_balance
+    are not indexed and only narrow what the other filters find.
+    """
+    try:
+        accounts = await ledger.list_accounts(
+            currency, name_prefix, min_balance, max_balance, after, limit
+        )
+    except AccountNotFoundException:
+        # A name-ordered page resumes from the cursor account's name
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    next_cursor = accounts[-1].id if len(accounts) == limit else None
+    return {"items": accounts, "next_cursor": next_cursor}
+
+
+@router.post("/lookup", response_model=List[Account])
+async def lookup_accounts(
+    lookup: AccountLookup, ledger: ShardedLedgerService = Depends(get_ledger)
+):
+    return await ledger.get_accounts(lookup.ids)
 
 
 @router.get("/{account_id}", response_model=Account)
-async def get_account(account_id: UUID, db: AsyncSession = Depends(get_db)):
-    service = LedgerService(db)
+async def get_account(
+    account_id: UUID, ledger: ShardedLedgerService = Depends(get_ledger)
+):
     try:
-        return await service.get_account(account_id)
+        return await ledger.get_account(account_id)
     except AccountNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -31,7 +68,24 @@ async def get_account_history(
     account_id: UUID,
     limit: int = 100,
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    after_seq: Optional[int] = None,
+    ledger: ShardedLedgerService = Depends(get_ledger),
+):
+    return await ledger.get_account_history(account_id, limit, offset, after_seq)
+
+
+@router.get("/{account_id}/summary", response_model=AccountSummary)
+async def get_account_summary(
+    account_id: UUID,
+    granularity: Granularity = Granularity.DAY,
+    from_: Optional[date] = Query(None, alias="from"),
+    to: Optional[date] = None,
+    ledger: ShardedLedgerService = Depends(get_ledger),
 ):
-    service = LedgerService(db)
-    return await service.get_account_history(account_id, limit, offset)
+    # Defaults to the year up to today (UTC), i.e. at most ~366 rollup rows
+    to = to or datetime.now(timezone.utc).date()
+    from_ = from_ or to - timedelta(days=365)
+    if from_ > to:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    periods = await ledger.get_summary(account_id, granularity, from_, to)
+    return {"account_id": account_id, "granularity": granularity, "periods": periods}
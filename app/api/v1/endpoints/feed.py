@@ -0,0 +1,87 @@
+import asyncio
+import json
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.sharding import shard_router
+from app.services.change_feed import change_feed, entry_event
+from app.services.ledger import LedgerService
+
+router = APIRouter()
+
+
+def _sse(event: dict, event_id: str) -> str:
+    return f"id: {event_id}\nevent: entry\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/")
+async def stream_entries(
+    request: Request,
+    account_id: Optional[UUID] = None,
+    after_seq: Optional[int] = None,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    Server-Sent Events stream of new ledger entries, per account or global.
+
+    Per-account streams are resumable: pass `after_seq` (or let the browser send
+    `Last-Event-ID`) and missed entries are replayed before live ones. The global
+    stream has no total order to resume from, so it is live-only.
+    """
+    if after_seq is None and last_event_id and last_event_id.isdigit():
+        after_seq = int(last_event_id)
+    if after_seq is not None and account_id is None:
+        raise HTTPException(
+            status_code=400, detail="Resuming requires an account_id stream"
+        )
+
+    # Subscribe before the backfill read so nothing committed in between is missed.
+    sub = change_feed.subscribe(account_id)
+
+    async def events():
+        try:
+            last_seq = after_seq
+            if account_id is not None and after_seq is not None:
+                async with shard_router.session_for(account_id) as db:
+                    service = LedgerService(db)
+                    while True:
+                        entries = await service.get_account_history(
+                            account_id,
+                            limit=settings.CHANGE_FEED_BACKFILL_BATCH,
+                            after_seq=last_seq,
+                        )
+                        for entry in entries:
+                            yield _sse(entry_event(entry), str(entry.seq))
+                            last_seq = entry.seq
+                        if len(entries) < settings.CHANGE_FEED_BACKFILL_BATCH:
+                            break
+
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(
+                        sub.queue.get(), settings.CHANGE_FEED_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if sub.overflowed:
+                    break  # Events were dropped; the client reconnects from its cursor
+                if account_id is None:
+                    yield _sse(event, f"{event['account_id']}:{event['seq']}")
+                    continue
+                if last_seq is not None and event["seq"] <= last_seq:
+                    continue  # Already sent during backfill
+                last_seq = event["seq"]
+                yield _sse(event, str(event["seq"]))
+        finally:
+            change_feed.unsubscribe(sub)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,77 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.core.config import settings
+from app.core.exceptions import (
+    AccountBusyException,
+    AccountNotFoundException,
+    HoldNotFoundException,
+    InsufficientFundsException,
+    InvalidTransactionException,
+)
+from app.schemas.hold import Hold, HoldCapture, HoldCreate
+from app.services.sharded_ledger import ShardedLedgerService, get_ledger
+
+router = APIRouter()
+
+
+HOLD_ERRORS = {
+    AccountNotFoundException: 404,
+    HoldNotFoundException: 404,
+    InsufficientFundsException: 400,
+    InvalidTransactionException: 409,  # Hold already captured, released or expired
+    AccountBusyException: 429,
+}
+
+
+def _http_error(e: Exception) -> HTTPException:
+    headers = None
+    if isinstance(e, AccountBusyException):
+        headers = {"Retry-After": str(settings.RETRY_AFTER_SECONDS)}
+    return HTTPException(status_code=HOLD_ERRORS[type(e)], detail=str(e), headers=headers)
+
+
+@router.post("/", response_model=Hold, status_code=status.HTTP_201_CREATED)
+async def create_hold(
+    account_id: UUID,
+    hold_in: HoldCreate,
+    ledger: ShardedLedgerService = Depends(get_ledger),
+):
+    try:
+        return await ledger.reserve(account_id, hold_in)
+    except tuple(HOLD_ERRORS) as e:
+        raise _http_error(e)
+
+
+@router.get("/{hold_id}", response_model=Hold)
+async def get_hold(
+    account_id: UUID, hold_id: UUID, ledger: ShardedLedgerService = Depends(get_ledger)
+):
+    try:
+        return await ledger.get_hold(account_id, hold_id)
+    except tuple(HOLD_ERRORS) as e:
+        raise _http_error(e)
+
+
+@router.post("/{hold_id}/capture", response_model=Hold)
+async def capture_hold(
+    account_id: UUID,
+    hold_id: UUID,
+    capture: HoldCapture,
+    ledger: ShardedLedgerService = Depends(get_ledger),
+):
+    try:
+        return await ledger.capture_hold(account_id, hold_id, capture.amount)
+    except tuple(HOLD_ERRORS) as e:
+        raise _http_error(e)
+
+
+@router.post("/{hold_id}/release", response_model=Hold)
+async def release_hold(
+    account_id: UUID, hold_id: UUID, ledger: ShardedLedgerService = Depends(get_ledger)
+):
+    try:
+        return await ledger.release_hold(account_id, hold_id)
+    except tuple(HOLD_ERRORS) as e:
+        raise _http_error(e)
@@ -1,12 +1,28 @@
-from typing import Optional
+import base64
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 
-from app.core.database import get_db
-from app.core.exceptions import AccountNotFoundException, InsufficientFundsException
-from app.schemas.transaction import TransactionCreate, TransactionResponse
-from app.services.ledger import LedgerService
+from app.core.admission import admission
+from app.core.config import settings
+from app.core.exceptions import (
+    AccountBusyException,
+    AccountNotFoundException,
+    InsufficientFundsException,
+    ServiceOverloadedException,
+    TransactionNotFoundException,
+)
+from app.schemas.transaction import (
+    TransactionCreate,
+    TransactionDetail,
+    TransactionPage,
+    TransactionResponse,
+    TransactionStatus,
+    TransactionType,
+)
+from app.services.sharded_ledger import ShardedLedgerService, get_ledger
 
 router = APIRouter()
 
@@ -17,15 +33,99 @@ router = APIRouter()
 async def create_transaction(
     transaction_in: TransactionCreate,
     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
-    db: AsyncSession = Depends(get_db),
+    ledger: ShardedLedgerService = Depends(get_ledger),
 ):
-    service = LedgerService(db)
+    account_ids = [transaction_in.account_id]
+    if transaction_in.receiver_id:
+        account_ids.append(transaction_in.receiver_id)
+    retry_after = {"Retry-After": str(settings.RETRY_AFTER_SECONDS)}
     try:
-        return await service.process_transaction(transaction_in, idempotency_key)
+        async with admission.admit(account_ids):
+            return await ledger.process_transaction(transaction_in, idempotency_key)
     except AccountNotFoundException as e:
         raise HTTPException(status_code=404, detail=str(e))
     except InsufficientFundsException as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except AccountBusyException as e:
+        raise HTTPException(status_code=429, detail=str(e), headers=retry_after)
+    except ServiceOverloadedException as e:
+        raise HTTPException(status_code=503, detail=str(e), headers=retry_after)
     except Exception as e:
         # In a real app, log this
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Query timestamps without an offset are taken as UTC
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _encode_cursor(created_at: datetime, transaction_id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{transaction_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        created_at, transaction_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        )
+        return datetime.fromisoformat(created_at), UUID(transaction_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("/", response_model=TransactionPage)
+async def search_transactions(
+    reference: Optional[str] = None,
+    reference_prefix: Optional[str] = Query(None, min_length=1),
+    tx_type: Optional[TransactionType] = Query(None, alias="type"),
+    tx_status: Optional[TransactionStatus] = Query(None, alias="status"),
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = None,
+    after: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    ledger: ShardedLedgerService = Depends(get_ledger),
+):
+    """
+    Newest first. `from` is inclusive and `to` exclusive; pass `next_cursor` back
+    as `after` for the next page. `reference_prefix` requires `from`, at most
+    TRANSACTION_PREFIX_SEARCH_MAX_DAYS before `to` (default now).
+    """
+    from_, to = _as_utc(from_), _as_utc(to)
+    if reference_prefix:
+        # Prefix matches are sorted rather than read in order, so cap how many
+        max_window = timedelta(days=settings.TRANSACTION_PREFIX_SEARCH_MAX_DAYS)
+        if from_ is None or (to or datetime.now(timezone.utc)) - from_ > max_window:
+            raise HTTPException(
+                status_code=400,
+                detail=f"reference_prefix needs a 'from' within "
+                f"{settings.TRANSACTION_PREFIX_SEARCH_MAX_DAYS} days of 'to'",
+            )
+    transactions = await ledger.search_transactions(
+        reference,
+        reference_prefix,
+        tx_type,
+        tx_status,
+        from_,
+        to,
+        _decode_cursor(after) if after else None,
+        limit,
+    )
+    next_cursor = None
+    if len(transactions) == limit:
+        last = transactions[-1]
+        next_cursor = _encode_cursor(last.created_at, last.id)
+    return {"items": transactions, "next_cursor": next_cursor}
+
+
+@router.get("/{transaction_id}", response_model=TransactionDetail)
+async def get_transaction(
+    transaction_id: UUID, ledger: ShardedLedgerService = Depends(get_ledger)
+):
+    try:
+        return await ledger.get_transaction(transaction_id)
+    except TransactionNotFoundException as e:
+        raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,126 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Iterable
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.exceptions import AccountBusyException, ServiceOverloadedException
+
+
+class _AccountSlot:
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.inflight = 0
+        self.queued = 0
+
+
+class AdmissionController:
+    """
+    Caps in-flight transactions per account and in total, per worker process.
+
+    Requests wait for their account slots *before* taking a global slot, so a
+    queue building up behind one hot account never holds capacity (and pooled
+    connections) that unrelated accounts could use.
+    """
+
+    def __init__(
+        self,
+        max_inflight: int,
+        max_inflight_per_account: int,
+        max_queued_per_account: int,
+        timeout: float,
+    ):
+        self.max_inflight = max_inflight
+        self.max_inflight_per_account = max_inflight_per_account
+        self.max_queued_per_account = max_queued_per_account
+        self.timeout = timeout
+        self._global = asyncio.Semaphore(max_inflight)
+        self._inflight = 0
+        self._slots: Dict[UUID, _AccountSlot] = {}
+
+    @asynccontextmanager
+    async def admit(self, account_ids: Iterable[UUID]):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout
+        acquired = []
+        try:
+            # Sorted, like the row locks, so two transfers can't wait on each other.
+            for account_id in sorted(set(account_ids)):
+                await self._acquire_account(account_id, deadline - loop.time())
+                acquired.append(account_id)
+
+            try:
+                await asyncio.wait_for(
+                    self._global.acquire(), max(deadline - loop.time(), 0)
+                )
+            except asyncio.TimeoutError:
+                raise ServiceOverloadedException(
+                    "Too many transactions in flight, retry later"
+                )
+            self._inflight += 1
+            try:
+                yield
+            finally:
+                self._inflight -= 1
+                self._global.release()
+        finally:
+            for account_id in acquired:
+                self._release_account(account_id)
+
+    async def _acquire_account(self, account_id: UUID, timeout: float) -> None:
+        slot = self._slots.get(account_id)
+        if slot is None:
+            slot = self._slots[account_id] = _AccountSlot(self.max_inflight_per_account)
+
+        if slot.semaphore.locked() and slot.queued >= self.max_queued_per_account:
+            raise AccountBusyException(
+                f"Account {account_id} has too many pending transactions"
+            )
+
+        slot.queued += 1
+        try:
+            await asyncio.wait_for(slot.semaphore.acquire(), max(timeout, 0))
+            slot.inflight += 1
+        except asyncio.TimeoutError:
+            raise AccountBusyException(f"Account {account_id} is busy, retry later")
+        finally:
+            slot.queued -= 1
+            self._discard_if_idle(account_id, slot)
+
+    def _release_account(self, account_id: UUID) -> None:
+        slot = self._slots[account_id]
+        slot.inflight -= 1
+        slot.semaphore.release()
+        self._discard_if_idle(account_id, slot)
+
+    def _discard_if_idle(self, account_id: UUID, slot: _AccountSlot) -> None:
+        # Slots only exist while an account has work, so the map stays small.
+        if slot.inflight == 0 and slot.queued == 0:
+            self._slots.pop(account_id, None)
+
+    def snapshot(self, top: int = 20) -> dict:
+        hot = sorted(
+            self._slots.items(),
+            key=lambda item: (item[1].queued, item[1].inflight),
+            reverse=True,
+        )[:top]
+        return {
+            "inflight": self._inflight,
+            "max_inflight": self.max_inflight,
+            "hot_accounts": [
+                {
+                    "account_id": str(account_id),
+                    "inflight": slot.inflight,
+                    "queued": slot.queued,
+                }
+                for account_id, slot in hot
+            ],
+        }
+
+
+admission = AdmissionController(
+    max_inflight=settings.MAX_INFLIGHT_TRANSACTIONS,
+    max_inflight_per_account=settings.MAX_INFLIGHT_PER_ACCOUNT,
+    max_queued_per_account=settings.MAX_QUEUED_PER_ACCOUNT,
+    timeout=settings.ADMISSION_TIMEOUT_SECONDS,
+)
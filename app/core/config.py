@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -15,10 +15,63 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = "5432"
     POSTGRES_DB: str = "ledger_db"
     DATABASE_URL: Optional[str] = None
+    # One URL per account shard, as a JSON list. Empty means one shard at DATABASE_URL.
+    # Shards are assigned by hashing the account ID, so never reorder this list.
+    SHARD_DATABASE_URLS: List[str] = []
+
+    # Connection pool, per engine (one per shard) per worker: keep
+    # workers * shards * (DB_POOL_SIZE + DB_MAX_OVERFLOW) under max_connections.
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Checks each connection on checkout, at the cost of a round trip per session
+    DB_POOL_PRE_PING: bool = False
+    # Connections opened per engine at startup, so the first requests skip the handshake
+    DB_POOL_PREWARM: int = 5
+    # Prepared statements cached per connection
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # Set when DATABASE_URL points at pgbouncer in transaction mode
+    DB_PGBOUNCER: bool = False
+
+    # Admission control for POST /transactions. Keep MAX_INFLIGHT_TRANSACTIONS
+    # below DB_POOL_SIZE so reads still get a connection under load.
+    MAX_INFLIGHT_TRANSACTIONS: int = 10
+    MAX_INFLIGHT_PER_ACCOUNT: int = 4
+    MAX_QUEUED_PER_ACCOUNT: int = 32
+    ADMISSION_TIMEOUT_SECONDS: float = 2.0
+    LOCK_TIMEOUT_MS: int = 4000
+    RETRY_AFTER_SECONDS: int = 1
+
+    # Change feed (GET /feed). LISTEN needs a session-level connection, so behind
+    # pgbouncer point these at Postgres directly. Empty means SHARD_DATABASE_URLS.
+    CHANGE_FEED_DATABASE_URLS: List[str] = []
+    CHANGE_FEED_QUEUE_SIZE: int = 1000
+    CHANGE_FEED_KEEPALIVE_SECONDS: float = 15.0
+    CHANGE_FEED_BACKFILL_BATCH: int = 500
+
+    # Recovery sweeper for cross-shard transfers left PENDING by a crash
+    TRANSFER_SWEEP_INTERVAL_SECONDS: float = 5.0
+    TRANSFER_SWEEP_MIN_AGE_SECONDS: float = 30.0
+    TRANSFER_SWEEP_BATCH: int = 100
+
+    # GET /transactions: longest from/to window allowed with reference_prefix
+    TRANSACTION_PREFIX_SEARCH_MAX_DAYS: int = 31
+
+    # Authorization holds
+    HOLD_DEFAULT_TTL_SECONDS: int = 7 * 24 * 3600
+    HOLD_MAX_TTL_SECONDS: int = 30 * 24 * 3600
+    HOLD_SWEEP_INTERVAL_SECONDS: float = 10.0
+    HOLD_SWEEP_BATCH: int = 500
 
     def model_post_init(self, __context):
         if self.DATABASE_URL is None:
             self.DATABASE_URL = f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        if not self.SHARD_DATABASE_URLS:
+            self.SHARD_DATABASE_URLS = [self.DATABASE_URL]
+        if not self.CHANGE_FEED_DATABASE_URLS:
+            self.CHANGE_FEED_DATABASE_URLS = self.SHARD_DATABASE_URLS
 
 
 settings = Settings()
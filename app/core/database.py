@@ -1,12 +1,69 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+import asyncio
+import logging
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
-SessionLocal = sessionmaker(
-    autocommit=False, autoflush=False, bind=engine, class_=AsyncSession
-)
+logger = logging.getLogger(__name__)
+
+
+def connect_args() -> dict:
+    """asyncpg options for every engine, the migration one included."""
+    if settings.DB_PGBOUNCER:
+        # In transaction mode consecutive transactions may run on different server
+        # connections, so a statement prepared on one can't be reused on the next.
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+
+
+def make_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=settings.DB_ECHO,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args(),
+    )
+
+
+def make_session_factory(bind: AsyncEngine) -> sessionmaker:
+    # Objects stay loaded after commit, so services return what they just wrote
+    # without a refresh round trip. Server-generated columns come back through
+    # RETURNING instead (eager_defaults on the models).
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=bind,
+        class_=AsyncSession,
+    )
+
+
+async def prewarm_pool(engine: AsyncEngine, connections: int) -> None:
+    """Open `connections` pooled connections at once and hand them back to the pool."""
+    opened = await asyncio.gather(
+        *(engine.connect().start() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    for conn in opened:
+        if isinstance(conn, Exception):
+            logger.warning("Pool pre-warm connection failed: %s", conn)
+        else:
+            await conn.close()
+
+
+engine = make_engine(settings.DATABASE_URL)
+SessionLocal = make_session_factory(engine)
 
 Base = declarative_base()
 
@@ -8,3 +8,19 @@ class InsufficientFundsException(Exception):
 
 class InvalidTransactionException(Exception):
     pass
+
+
+class AccountBusyException(Exception):
+    pass
+
+
+class ServiceOverloadedException(Exception):
+    pass
+
+
+class HoldNotFoundException(Exception):
+    pass
+
+
+class TransactionNotFoundException(Exception):
+    pass
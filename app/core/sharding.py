@@ -0,0 +1,58 @@
+import hashlib
+from typing import List
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine, make_engine, make_session_factory
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """
+    Jump consistent hash (Lamping & Veach). Growing from N to N+1 buckets moves
+    only 1/(N+1) of the keys, all of them into the new bucket.
+    """
+    b, j = -1, 0
+    while j < buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+    return b
+
+
+class ShardRouter:
+    """Maps account IDs to shards; each shard has its own engine and pool."""
+
+    def __init__(self, urls: List[str]):
+        self.urls = urls
+        self.engines = []
+        self._session_factories = []
+        for url in urls:
+            if url == settings.DATABASE_URL:
+                # The primary keeps the app-wide engine rather than a second pool
+                self.engines.append(engine)
+                self._session_factories.append(SessionLocal)
+                continue
+            shard_engine = make_engine(url)
+            self.engines.append(shard_engine)
+            self._session_factories.append(make_session_factory(shard_engine))
+
+    @property
+    def shard_count(self) -> int:
+        return len(self.urls)
+
+    def shard_for(self, account_id: UUID) -> int:
+        # Hash the bytes rather than use them directly: seeded or imported IDs
+        # aren't necessarily uniformly random.
+        digest = hashlib.blake2b(account_id.bytes, digest_size=8).digest()
+        return jump_hash(int.from_bytes(digest, "big"), self.shard_count)
+
+    def session(self, shard: int) -> AsyncSession:
+        return self._session_factories[shard]()
+
+    def session_for(self, account_id: UUID) -> AsyncSession:
+        return self.session(self.shard_for(account_id))
+
+
+shard_router = ShardRouter(settings.SHARD_DATABASE_URLS)
@@ -1,7 +1,12 @@
 from fastapi import FastAPI
 
 from app.api.v1.api import api_router
+from app.core.admission import admission
 from app.core.config import settings
+from app.core.database import prewarm_pool
+from app.core.sharding import shard_router
+from app.services.change_feed import change_feed
+from app.services.sharded_ledger import ShardedLedgerService, run_forever
 
 from contextlib import asynccontextmanager
 from alembic.config import Config
@@ -19,7 +24,34 @@ async def lifespan(app: FastAPI):
         await loop.run_in_executor(None, command.upgrade, alembic_cfg, "head")
     except Exception as e:
         print(f"Migration failed: {e}")
+    await asyncio.gather(
+        *(
+            prewarm_pool(shard_engine, min(settings.DB_POOL_PREWARM, settings.DB_POOL_SIZE))
+            for shard_engine in shard_router.engines
+        )
+    )
+    await change_feed.start()
+    ledger = ShardedLedgerService(shard_router)
+    sweepers = [
+        asyncio.create_task(
+            run_forever(ledger.expire_holds, settings.HOLD_SWEEP_INTERVAL_SECONDS)
+        )
+    ]
+    # Cross-shard transfers only exist with more than one shard
+    if shard_router.shard_count > 1:
+        sweepers.append(
+            asyncio.create_task(
+                run_forever(
+                    ledger.sweep_transfers, settings.TRANSFER_SWEEP_INTERVAL_SECONDS
+                )
+            )
+        )
     yield
+    for sweeper in sweepers:
+        sweeper.cancel()
+    await change_feed.stop()
+    for shard_engine in shard_router.engines:
+        await shard_engine.dispose()
 
 app = FastAPI(
     title=settings.PROJECT_NAME, 
@@ -33,3 +65,9 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
+
+
+@app.get("/health/admission")
+def admission_status():
+    # In-flight and queued transactions for this worker, hottest accounts first
+    return admission.snapshot()
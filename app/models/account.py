@@ -1,6 +1,15 @@
 import uuid
 
-from sqlalchemy import Column, DateTime, Numeric, String, func
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Index,
+    Numeric,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -8,10 +17,31 @@ from app.core.database import Base
 
 class Account(Base):
     __tablename__ = "accounts"
+    __table_args__ = (
+        # Filters for GET /accounts; pages are keyset-ordered by id, or by
+        # (name, id) with name_prefix so the prefix range is read in page order.
+        # The C collation makes the name index usable for LIKE 'prefix%' and
+        # the ORDER BY alike, whatever the database collation. balance is
+        # deliberately unindexed: it changes on every posting and an index on it
+        # would turn those into non-HOT updates, so a balance range is a
+        # residual filter along whichever index the other criteria pick.
+        Index("ix_accounts_currency_id", "currency", "id"),
+        Index("ix_accounts_name_id", text('name COLLATE "C"'), "id"),
+    )
+    # No eager_defaults: nothing reads updated_at back after a posting, and
+    # RETURNING would stop a transfer's two balance UPDATEs being batched.
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
     currency = Column(String(3), nullable=False)  # USD, INR
     balance = Column(Numeric(20, 2), default=0, nullable=False)
+    # Sum of ACTIVE holds; spendable funds are balance - reserved
+    reserved = Column(Numeric(20, 2), default=0, server_default="0", nullable=False)
+    # Seq of the latest ledger entry; bumped under the row lock held while posting
+    last_entry_seq = Column(BigInteger, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    @property
+    def available_balance(self):
+        return self.balance - self.reserved
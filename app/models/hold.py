@@ -0,0 +1,52 @@
+import enum
+import uuid
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class HoldStatus(str, enum.Enum):
+    ACTIVE = "ACTIVE"
+    CAPTURED = "CAPTURED"
+    RELEASED = "RELEASED"
+    EXPIRED = "EXPIRED"
+
+
+class Hold(Base):
+    __tablename__ = "holds"
+    __table_args__ = (
+        # The expiry sweeper only ever looks at ACTIVE holds, soonest first
+        Index(
+            "ix_holds_active_expires_at",
+            "expires_at",
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+    )
+    # created_at/updated_at come back via RETURNING rather than a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    account_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
+    amount = Column(Numeric(20, 2), nullable=False)
+    captured_amount = Column(Numeric(20, 2), nullable=True)
+    status = Column(Enum(HoldStatus), default=HoldStatus.ACTIVE, nullable=False)
+    reference = Column(String, nullable=True)
+    # Set on capture: the WITHDRAWAL that moved the money
+    transaction_id = Column(
+        UUID(as_uuid=True), ForeignKey("transactions.id"), nullable=True
+    )
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -1,7 +1,7 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Numeric, func
+from sqlalchemy import BigInteger, Column, DateTime, Enum, ForeignKey, Index, Numeric, func
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.core.database import Base
@@ -14,6 +14,13 @@ class EntryDirection(str, enum.Enum):
 
 class LedgerEntry(Base):
     __tablename__ = "ledger_entries"
+    __table_args__ = (
+        # Per-account ordering: statements, gap detection and incremental sync
+        # (?after_seq=) are all range reads on this index.
+        Index("ix_ledger_entries_account_id_seq", "account_id", "seq", unique=True),
+        # Entries of one transaction, for GET /transactions/{id}
+        Index("ix_ledger_entries_transaction_id", "transaction_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     transaction_id = Column(
@@ -24,4 +31,6 @@ class LedgerEntry(Base):
         Numeric(20, 2), nullable=False
     )  # Signed amount: + for Credit, - for Debit
     direction = Column(Enum(EntryDirection), nullable=False)
+    seq = Column(BigInteger, nullable=False)  # 1, 2, 3... per account, no gaps
+    balance_after = Column(Numeric(20, 2), nullable=False)  # Account balance after this entry
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,33 @@
+from sqlalchemy import BigInteger, Column, Date, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+# Both tables are upserted in the same transaction as the entries they
+# summarise (see app/services/rollups.py), so they're never stale. Periods
+# are UTC; days without activity have no row.
+
+
+class AccountDailyRollup(Base):
+    __tablename__ = "account_daily_rollups"
+
+    account_id = Column(UUID(as_uuid=True), primary_key=True)
+    day = Column(Date, primary_key=True)
+    credits = Column(Numeric(20, 2), nullable=False)
+    debits = Column(Numeric(20, 2), nullable=False)  # Positive total of debit entries
+    entry_count = Column(Integer, nullable=False)
+    closing_balance = Column(Numeric(20, 2), nullable=False)
+    last_seq = Column(BigInteger, nullable=False)
+
+
+class AccountMonthlyRollup(Base):
+    __tablename__ = "account_monthly_rollups"
+
+    account_id = Column(UUID(as_uuid=True), primary_key=True)
+    month = Column(Date, primary_key=True)  # First day of the month
+    credits = Column(Numeric(20, 2), nullable=False)
+    debits = Column(Numeric(20, 2), nullable=False)
+    entry_count = Column(Integer, nullable=False)
+    closing_balance = Column(Numeric(20, 2), nullable=False)
+    last_seq = Column(BigInteger, nullable=False)
@@ -1,8 +1,9 @@
 import enum
 import uuid
 
-from sqlalchemy import Column, DateTime, Enum, String, func
+from sqlalchemy import Column, DateTime, Enum, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 
@@ -21,6 +22,31 @@ class TransactionStatus(str, enum.Enum):
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # GET /transactions pages newest first on (created_at, id). An exact
+        # reference comes out of the second index already in that order; a
+        # prefix range doesn't, so its matches get sorted, which is why prefix
+        # searches need a bounded time window. type has no index: it's filtered
+        # along whichever index the other criteria pick.
+        Index("ix_transactions_created_at_id", "created_at", "id"),
+        Index(
+            "ix_transactions_reference_created_at_id",
+            "reference",
+            "created_at",
+            "id",
+            postgresql_ops={"reference": "text_pattern_ops"},
+        ),
+        # Pending/failed rows are a sliver of the table; searching for them
+        # shouldn't walk every completed one.
+        Index(
+            "ix_transactions_unsettled_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("status <> 'COMPLETED'"),
+        ),
+    )
+    # Fetch created_at with the INSERT: services return transactions straight after commit
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     idempotency_key = Column(String, unique=True, index=True, nullable=True)
@@ -30,3 +56,6 @@ class Transaction(Base):
     )
     reference = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Only ever loaded explicitly (joinedload); a lazy load can't run under asyncio.
+    entries = relationship("LedgerEntry", order_by="LedgerEntry.direction", lazy="raise")
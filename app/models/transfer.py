@@ -0,0 +1,56 @@
+import enum
+import uuid
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.core.database import Base
+
+
+class TransferStatus(str, enum.Enum):
+    PENDING = "PENDING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class CrossShardTransfer(Base):
+    """
+    Lives on the sender's shard. Written in the same transaction as the debit,
+    it is the durable record that the receiver's shard still owes a credit.
+    """
+
+    __tablename__ = "cross_shard_transfers"
+    __table_args__ = (
+        # The sweeper only ever looks at PENDING rows, oldest first
+        Index(
+            "ix_cross_shard_transfers_pending",
+            "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+    )
+    # created_at/updated_at come back via RETURNING rather than a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    transaction_id = Column(
+        UUID(as_uuid=True), ForeignKey("transactions.id"), nullable=False, unique=True
+    )
+    sender_id = Column(UUID(as_uuid=True), ForeignKey("accounts.id"), nullable=False)
+    receiver_id = Column(UUID(as_uuid=True), nullable=False)  # On another shard: no FK
+    amount = Column(Numeric(20, 2), nullable=False)
+    reference = Column(String, nullable=True)
+    status = Column(
+        Enum(TransferStatus), default=TransferStatus.PENDING, nullable=False
+    )
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
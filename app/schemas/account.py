@@ -1,9 +1,9 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class AccountBase(BaseModel):
@@ -23,8 +23,19 @@ class AccountCreate(AccountBase):
 
 class Account(AccountBase):
     id: UUID
-    balance: Decimal
+    balance: Decimal  # Ledger balance
+    available_balance: Decimal  # Ledger balance minus active holds
     created_at: datetime
     updated_at: Optional[datetime] = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class AccountLookup(BaseModel):
+    # Answered by a single `id = ANY(:ids)` query
+    ids: List[UUID] = Field(..., min_length=1, max_length=5000)
+
+
+class AccountPage(BaseModel):
+    items: List[Account]
+    next_cursor: Optional[UUID] = None  # Pass as ?after= to fetch the next page
@@ -0,0 +1,44 @@
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Annotated, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.core.config import settings
+
+
+class HoldStatus(str, Enum):
+    ACTIVE = "ACTIVE"
+    CAPTURED = "CAPTURED"
+    RELEASED = "RELEASED"
+    EXPIRED = "EXPIRED"
+
+
+class HoldCreate(BaseModel):
+    amount: Decimal = Field(..., gt=0, decimal_places=2)
+    reference: Optional[str] = None
+    expires_in_seconds: int = Field(
+        settings.HOLD_DEFAULT_TTL_SECONDS, gt=0, le=settings.HOLD_MAX_TTL_SECONDS
+    )
+
+
+class HoldCapture(BaseModel):
+    # Omit to capture the full hold; any uncaptured remainder is released
+    amount: Optional[Annotated[Decimal, Field(gt=0, decimal_places=2)]] = None
+
+
+class Hold(BaseModel):
+    id: UUID
+    account_id: UUID
+    amount: Decimal
+    captured_amount: Optional[Decimal]
+    status: HoldStatus
+    reference: Optional[str]
+    transaction_id: Optional[UUID]
+    expires_at: datetime
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
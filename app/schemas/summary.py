@@ -0,0 +1,27 @@
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class Granularity(str, Enum):
+    DAY = "day"
+    MONTH = "month"
+
+
+class SummaryPeriod(BaseModel):
+    period_start: date
+    credits: Decimal
+    debits: Decimal
+    entry_count: int
+    closing_balance: Decimal
+
+
+class AccountSummary(BaseModel):
+    account_id: UUID
+    granularity: Granularity
+    # Only periods with activity; carry closing_balance forward across gaps
+    periods: List[SummaryPeriod]
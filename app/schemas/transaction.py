@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -58,3 +58,31 @@ class TransactionResponse(BaseModel):
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class EntryDirection(str, Enum):
+    DEBIT = "DEBIT"
+    CREDIT = "CREDIT"
+
+
+class LedgerEntryResponse(BaseModel):
+    id: UUID
+    account_id: UUID
+    amount: Decimal  # Signed: + for Credit, - for Debit
+    direction: EntryDirection
+    seq: int
+    balance_after: Decimal
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TransactionDetail(TransactionResponse):
+    # Entries on this transaction's shard; the two legs of a cross-shard
+    # transfer are separate transactions.
+    entries: List[LedgerEntryResponse]
+
+
+class TransactionPage(BaseModel):
+    items: List[TransactionResponse]
+    next_cursor: Optional[str] = None  # Pass as ?after= to fetch the next page
@@ -0,0 +1,156 @@
+import asyncio
+import json
+import logging
+from decimal import Decimal
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.ledger_entry import LedgerEntry
+
+CHANNEL = "ledger_entries"
+CENTS = Decimal("0.01")
+
+logger = logging.getLogger(__name__)
+
+
+def _money(value: Decimal) -> str:
+    # The columns are NUMERIC(20, 2): entries being posted hold the amount as
+    # entered, replayed ones what the database stored. Both must read alike.
+    return str(value.quantize(CENTS))
+
+
+def entry_event(entry: LedgerEntry) -> dict:
+    # Also the NOTIFY payload, so keep it well under Postgres' 8000 byte limit.
+    return {
+        "id": str(entry.id),
+        "transaction_id": str(entry.transaction_id),
+        "account_id": str(entry.account_id),
+        "amount": _money(entry.amount),
+        "direction": entry.direction.value,
+        "seq": entry.seq,
+        "balance_after": _money(entry.balance_after),
+    }
+
+
+async def publish_entries(db: AsyncSession, entries: List[LedgerEntry]) -> None:
+    """Queue a NOTIFY per entry. Postgres only delivers them if the transaction commits."""
+    payloads = [json.dumps(entry_event(entry)) for entry in entries]
+    await db.execute(
+        text(
+            "SELECT pg_notify(:channel, payload) "
+            "FROM unnest(CAST(:payloads AS text[])) AS payload"
+        ),
+        {"channel": CHANNEL, "payloads": payloads},
+    )
+
+
+class Subscription:
+    def __init__(self, account_id: Optional[UUID], queue_size: int):
+        self.account_id = account_id
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        # Set when events were dropped; the stream must end so the client resumes.
+        self.overflowed = False
+
+
+class ChangeFeed:
+    """
+    One LISTEN connection per shard per worker, fanned out to in-process subscribers.
+
+    Delivery is at-most-once: a slow subscriber or a lost listener connection
+    ends the affected streams, and clients resume from their cursor.
+    """
+
+    def __init__(self, dsns: List[str], queue_size: int, reconnect_delay: float = 1.0):
+        self.dsns = dsns  # One listener per shard
+        self.queue_size = queue_size
+        self.reconnect_delay = reconnect_delay
+        self._global: Set[Subscription] = set()
+        self._by_account: Dict[UUID, Set[Subscription]] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._run(dsn)) for dsn in self.dsns]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def subscribe(self, account_id: Optional[UUID] = None) -> Subscription:
+        sub = Subscription(account_id, self.queue_size)
+        if account_id is None:
+            self._global.add(sub)
+        else:
+            self._by_account.setdefault(account_id, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        if sub.account_id is None:
+            self._global.discard(sub)
+            return
+        subs = self._by_account.get(sub.account_id)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._by_account[sub.account_id]
+
+    async def _run(self, dsn: str) -> None:
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(dsn)
+                closed = asyncio.Event()
+                conn.add_termination_listener(lambda _: closed.set())
+                await conn.add_listener(CHANNEL, self._on_notify)
+                await closed.wait()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Change feed listener failed, reconnecting")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+                # Notifications sent while we weren't listening are gone.
+                self._end_all()
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _on_notify(self, conn, pid, channel, payload: str) -> None:
+        self._dispatch(json.loads(payload))
+
+    def _dispatch(self, event: dict) -> None:
+        subs = list(self._global)
+        subs += self._by_account.get(UUID(event["account_id"]), ())
+        for sub in subs:
+            try:
+                sub.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self._end(sub)
+
+    def _end(self, sub: Subscription) -> None:
+        sub.overflowed = True
+        self.unsubscribe(sub)
+        if sub.queue.empty():
+            sub.queue.put_nowait(None)  # Wake the reader so it notices
+
+    def _end_all(self) -> None:
+        for sub in list(self._global):
+            self._end(sub)
+        for subs in list(self._by_account.values()):
+            for sub in list(subs):
+                self._end(sub)
+
+
+change_feed = ChangeFeed(
+    dsns=[
+        make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+        for url in settings.CHANGE_FEED_DATABASE_URLS
+    ],
+    queue_size=settings.CHANGE_FEED_QUEUE_SIZE,
+)
@@ -1,26 +1,90 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import any_, func, insert, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 from sqlalchemy import text
 
-from app.core.exceptions import AccountNotFoundException, InsufficientFundsException
+from app.core.config import settings
+from app.core.exceptions import (
+    AccountBusyException,
+    AccountNotFoundException,
+    HoldNotFoundException,
+    InsufficientFundsException,
+    InvalidTransactionException,
+    TransactionNotFoundException,
+)
 from app.models.account import Account
+from app.models.hold import Hold, HoldStatus
 from app.models.ledger_entry import EntryDirection, LedgerEntry
+from app.models.rollup import AccountDailyRollup, AccountMonthlyRollup
 from app.models.transaction import Transaction, TransactionStatus, TransactionType
+from app.models.transfer import CrossShardTransfer, TransferStatus
 from app.schemas.account import AccountCreate
+from app.schemas.hold import HoldCreate
+from app.schemas.summary import Granularity
 from app.schemas.transaction import TransactionCreate
+from app.services.change_feed import publish_entries
+from app.services.rollups import apply_rollups
+
+LOCK_NOT_AVAILABLE = "55P03"
+
+EXPIRE_HOLDS = text(
+    """
+    WITH expired AS (
+        UPDATE holds SET status = 'EXPIRED', updated_at = now()
+        WHERE id IN (
+            SELECT id FROM holds
+            WHERE status = 'ACTIVE' AND expires_at <= now()
+            ORDER BY expires_at
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING account_id, amount
+    ), released AS (
+        UPDATE accounts AS a
+        SET reserved = a.reserved - e.total
+        FROM (
+            SELECT account_id, sum(amount) AS total FROM expired GROUP BY account_id
+        ) AS e
+        WHERE a.id = e.account_id
+    )
+    SELECT count(*) FROM expired
+    """
+)
+
+
+def _like_prefix(prefix: str) -> str:
+    # Whole pattern as one bind value so a text_pattern_ops index applies
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def _sqlstate(error: DBAPIError) -> Optional[str]:
+    # asyncpg exposes the code as `sqlstate`; SQLAlchemy's adapter mirrors it as `pgcode`.
+    orig = error.orig
+    return getattr(orig, "pgcode", None) or getattr(
+        getattr(orig, "__cause__", None), "sqlstate", None
+    )
 
 
 class LedgerService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def create_account(self, account_in: AccountCreate) -> Account:
-        account = Account(name=account_in.name, currency=account_in.currency)
+    async def create_account(
+        self, account_in: AccountCreate, account_id: Optional[UUID] = None
+    ) -> Account:
+        account = Account(
+            id=account_id, name=account_in.name, currency=account_in.currency
+        )
         self.db.add(account)
         await self.db.commit()
-        await self.db.refresh(account)
         return account
 
     async def get_account(self, account_id: UUID) -> Account:
@@ -30,43 +94,140 @@ class LedgerService:
             raise AccountNotFoundException(f"Account {account_id} not found")
         return account
 
+    async def get_accounts(self, account_ids: List[UUID]) -> List[Account]:
+        # One round trip regardless of how many ids; unknown ids are simply absent.
+        ids = literal(list(set(account_ids)), ARRAY(PG_UUID(as_uuid=True)))
+        result = await self.db.execute(select(Account).where(Account.id == any_(ids)))
+        return result.scalars().all()
+
+    async def list_accounts(
+        self,
+        currency: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        min_balance: Optional[Decimal] = None,
+        max_balance: Optional[Decimal] = None,
+        after: Optional[UUID] = None,
+        limit: int = 100,
+        after_name: Optional[str] = None,
+    ) -> List[Account]:
+        """
+        Pages are ordered by id, or by (name, id) with `name_prefix`, which then
+        needs `after_name`, the name of the `after` account, to continue a page.
+        """
+        stmt = select(Account)
+        if currency:
+            stmt = stmt.where(Account.currency == currency.upper())
+        if min_balance is not None:
+            stmt = stmt.where(Account.balance >= min_balance)
+        if max_balance is not None:
+            stmt = stmt.where(Account.balance <= max_balance)
+        if name_prefix:
+            # Walks the prefix range of ix_accounts_name_id in page order, so a
+            # page stops after `limit` matches and a rare prefix reads little.
+            name = Account.name.collate("C")
+            stmt = stmt.where(name.like(_like_prefix(name_prefix), escape="\\"))
+            if after:
+                stmt = stmt.where(tuple_(name, Account.id) > tuple_(after_name, after))
+            stmt = stmt.order_by(name, Account.id)
+        else:
+            if after:
+                stmt = stmt.where(Account.id > after)
+            stmt = stmt.order_by(Account.id)
+        result = await self.db.execute(stmt.limit(limit))
+        return result.scalars().all()
+
+    async def get_summary(
+        self, account_id: UUID, granularity: Granularity, start: date, end: date
+    ) -> List[dict]:
+        # Reads rollups only: at most one row per period in [start, end]
+        if granularity == Granularity.MONTH:
+            rollup, period = AccountMonthlyRollup, AccountMonthlyRollup.month
+            start = start.replace(day=1)
+        else:
+            rollup, period = AccountDailyRollup, AccountDailyRollup.day
+        stmt = (
+            select(
+                period.label("period_start"),
+                rollup.credits,
+                rollup.debits,
+                rollup.entry_count,
+                rollup.closing_balance,
+            )
+            .where(rollup.account_id == account_id, period >= start, period <= end)
+            .order_by(period)
+        )
+        result = await self.db.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+
+    async def search_transactions(
+        self,
+        reference: Optional[str] = None,
+        reference_prefix: Optional[str] = None,
+        tx_type: Optional[TransactionType] = None,
+        tx_status: Optional[TransactionStatus] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+    ) -> List[Transaction]:
+        """Newest first, keyset-paginated on (created_at, id): pass the last row's pair as `after`."""
+        stmt = select(Transaction)
+        if reference is not None:
+            stmt = stmt.where(Transaction.reference == reference)
+        if reference_prefix:
+            stmt = stmt.where(
+                Transaction.reference.like(_like_prefix(reference_prefix), escape="\\")
+            )
+        if tx_type:
+            stmt = stmt.where(Transaction.type == tx_type)
+        if tx_status:
+            stmt = stmt.where(Transaction.status == tx_status)
+            if tx_status != TransactionStatus.COMPLETED:
+                # Matches the partial index predicate as a literal: the planner
+                # can't prove it from a bind parameter under a generic plan.
+                stmt = stmt.where(text("transactions.status <> 'COMPLETED'"))
+        if start:
+            stmt = stmt.where(Transaction.created_at >= start)
+        if end:
+            stmt = stmt.where(Transaction.created_at < end)
+        if after:
+            stmt = stmt.where(
+                tuple_(Transaction.created_at, Transaction.id) < tuple_(*after)
+            )
+        stmt = stmt.order_by(Transaction.created_at.desc(), Transaction.id.desc())
+        result = await self.db.execute(stmt.limit(limit))
+        return result.scalars().all()
+
+    async def get_transaction(self, transaction_id: UUID) -> Transaction:
+        # Transaction and entries in one joined query
+        result = await self.db.execute(
+            select(Transaction)
+            .options(joinedload(Transaction.entries))
+            .where(Transaction.id == transaction_id)
+        )
+        transaction = result.unique().scalar_one_or_none()
+        if not transaction:
+            raise TransactionNotFoundException(f"Transaction {transaction_id} not found")
+        return transaction
+
     async def process_transaction(
         self, tx_in: TransactionCreate, idempotency_key: str = None
     ) -> Transaction:
         # 1. Check Idempotency
         if idempotency_key:
-            stmt = select(Transaction).where(
-                Transaction.idempotency_key == idempotency_key
-            )
-            result = await self.db.execute(stmt)
-            existing_tx = result.scalar_one_or_none()
+            existing_tx = await self._find_by_idempotency_key(idempotency_key)
             if existing_tx:
                 # Do NOT raise error. This allows clients to safely retry (e.g., on network timeout)
                 # without duplicate billing or confusion.
                 return existing_tx
 
-
         # 2. Lock Accounts (Pessimistic Locking)
         # Determine involved accounts
         involved_account_ids = [tx_in.account_id]
         if tx_in.type == TransactionType.TRANSFER and tx_in.receiver_id:
             involved_account_ids.append(tx_in.receiver_id)
 
-        # Sort to prevent deadlocks
-        involved_account_ids.sort()
-
-        # Select FOR UPDATE
-        # We fetch accounts in a loop or single query. Single query is better.
-        stmt = (
-            select(Account)
-            .where(Account.id.in_(involved_account_ids))
-            .with_for_update()
-        )
-        # Optional: Set a lock timeout here if needed for DoS protection
-        # await self.db.execute(text("SET LOCAL lock_timeout = '4s'"))
-        
-        result = await self.db.execute(stmt)
-        accounts_map = {acc.id: acc for acc in result.scalars().all()}
+        accounts_map = await self._lock_accounts(involved_account_ids)
 
         # Validate all accounts exist
         if tx_in.account_id not in accounts_map:
@@ -86,16 +247,16 @@ class LedgerService:
         if tx_in.type == TransactionType.DEPOSIT:
             account.balance += tx_in.amount
         elif tx_in.type == TransactionType.WITHDRAWAL:
-            if account.balance < tx_in.amount:
+            if account.available_balance < tx_in.amount:
                 raise InsufficientFundsException(
-                    f"Insufficient funds for withdrawal. Balance: {account.balance}"
+                    f"Insufficient funds for withdrawal. Available: {account.available_balance}"
                 )
             account.balance -= tx_in.amount
         elif tx_in.type == TransactionType.TRANSFER:
             receiver = accounts_map[tx_in.receiver_id]
-            if account.balance < tx_in.amount:
+            if account.available_balance < tx_in.amount:
                 raise InsufficientFundsException(
-                    f"Insufficient funds for transfer. Balance: {account.balance}"
+                    f"Insufficient funds for transfer. Available: {account.available_balance}"
                 )
             account.balance -= tx_in.amount
             receiver.balance += tx_in.amount
@@ -111,66 +272,365 @@ class LedgerService:
         await self.db.flush()  # Get ID
 
         # 5. Create Ledger Entries (Double Entry)
+        # Balances were updated in step 3, so each entry snapshots the post-entry balance.
         entries = []
         if tx_in.type == TransactionType.DEPOSIT:
             # Credit User
             entries.append(
-                LedgerEntry(
-                    transaction_id=transaction.id,
-                    account_id=account.id,
-                    amount=tx_in.amount,
-                    direction=EntryDirection.CREDIT,
-                )
+                self._entry(transaction, account, tx_in.amount, EntryDirection.CREDIT)
             )
             # Debit System (Implicit/Virtual for now, or we'd add a system account entry)
 
         elif tx_in.type == TransactionType.WITHDRAWAL:
             # Debit User
             entries.append(
-                LedgerEntry(
-                    transaction_id=transaction.id,
-                    account_id=account.id,
-                    amount=-tx_in.amount,
-                    direction=EntryDirection.DEBIT,
-                )
+                self._entry(transaction, account, -tx_in.amount, EntryDirection.DEBIT)
             )
 
         elif tx_in.type == TransactionType.TRANSFER:
             # Debit Sender
             entries.append(
-                LedgerEntry(
-                    transaction_id=transaction.id,
-                    account_id=account.id,
-                    amount=-tx_in.amount,
-                    direction=EntryDirection.DEBIT,
-                )
+                self._entry(transaction, account, -tx_in.amount, EntryDirection.DEBIT)
             )
             # Credit Receiver
             entries.append(
-                LedgerEntry(
-                    transaction_id=transaction.id,
-                    account_id=receiver.id,
-                    amount=tx_in.amount,
-                    direction=EntryDirection.CREDIT,
+                self._entry(transaction, receiver, tx_in.amount, EntryDirection.CREDIT)
+            )
+
+        # 6. Commit (publishing to the change feed)
+        await self._commit_entries(entries)
+        return transaction
+
+    async def begin_transfer(
+        self, tx_in: TransactionCreate, idempotency_key: str = None
+    ) -> Tuple[Transaction, Optional[CrossShardTransfer]]:
+        """
+        Phase 1 of a cross-shard transfer, on the sender's shard: debit the sender
+        and record a PENDING transfer in one local transaction.
+        """
+        if idempotency_key:
+            existing_tx = await self._find_by_idempotency_key(idempotency_key)
+            if existing_tx:
+                result = await self.db.execute(
+                    select(CrossShardTransfer).where(
+                        CrossShardTransfer.transaction_id == existing_tx.id
+                    )
                 )
+                return existing_tx, result.scalar_one_or_none()
+
+        accounts_map = await self._lock_accounts([tx_in.account_id])
+        if tx_in.account_id not in accounts_map:
+            raise AccountNotFoundException(f"Account {tx_in.account_id} not found")
+        account = accounts_map[tx_in.account_id]
+        if account.available_balance < tx_in.amount:
+            raise InsufficientFundsException(
+                f"Insufficient funds for transfer. Available: {account.available_balance}"
             )
+        account.balance -= tx_in.amount
 
-        self.db.add_all(entries)
+        transaction = Transaction(
+            idempotency_key=idempotency_key,
+            type=TransactionType.TRANSFER,
+            status=TransactionStatus.PENDING,
+            reference=tx_in.reference,
+        )
+        self.db.add(transaction)
+        await self.db.flush()
+
+        transfer = CrossShardTransfer(
+            transaction_id=transaction.id,
+            sender_id=account.id,
+            receiver_id=tx_in.receiver_id,
+            amount=tx_in.amount,
+            reference=tx_in.reference,
+        )
+        self.db.add(transfer)
+        await self._commit_entries(
+            [self._entry(transaction, account, -tx_in.amount, EntryDirection.DEBIT)]
+        )
+        return transaction, transfer
+
+    async def receive_transfer(self, transfer: CrossShardTransfer) -> Transaction:
+        """
+        Phase 2, on the receiver's shard: credit the receiver. Idempotent, keyed
+        on the transfer ID, so the sweeper can safely replay it.
+        """
+        accounts_map = await self._lock_accounts([transfer.receiver_id])
+        if transfer.receiver_id not in accounts_map:
+            raise AccountNotFoundException(
+                f"Receiver account {transfer.receiver_id} not found"
+            )
+        # Checked under the receiver's lock so concurrent replays serialize here
+        idempotency_key = f"transfer:{transfer.id}"
+        existing_tx = await self._find_by_idempotency_key(idempotency_key)
+        if existing_tx:
+            await self.db.rollback()
+            return existing_tx
+
+        receiver = accounts_map[transfer.receiver_id]
+        receiver.balance += transfer.amount
+        transaction = Transaction(
+            idempotency_key=idempotency_key,
+            type=TransactionType.TRANSFER,
+            status=TransactionStatus.COMPLETED,
+            reference=transfer.reference,
+        )
+        self.db.add(transaction)
+        await self.db.flush()
+        await self._commit_entries(
+            [self._entry(transaction, receiver, transfer.amount, EntryDirection.CREDIT)]
+        )
+        return transaction
 
-        # 6. Commit
+    async def complete_transfer(self, transfer_id: UUID) -> Transaction:
+        """Phase 3, back on the sender's shard: mark the transfer done."""
+        transfer = await self._lock_transfer(transfer_id)
+        transaction = await self.db.get(Transaction, transfer.transaction_id)
+        if transfer.status == TransferStatus.PENDING:
+            transfer.status = TransferStatus.COMPLETED
+            transaction.status = TransactionStatus.COMPLETED
         await self.db.commit()
-        await self.db.refresh(transaction)
         return transaction
 
-    async def get_account_history(
-        self, account_id: UUID, limit: int = 100, offset: int = 0
-    ):
+    async def fail_transfer(self, transfer_id: UUID) -> Transaction:
+        """Compensate phase 1 when the credit can never happen: refund the sender."""
+        transfer = await self._lock_transfer(transfer_id)
+        transaction = await self.db.get(Transaction, transfer.transaction_id)
+        if transfer.status != TransferStatus.PENDING:
+            await self.db.commit()
+            return transaction
+
+        accounts_map = await self._lock_accounts([transfer.sender_id])
+        sender = accounts_map[transfer.sender_id]
+        sender.balance += transfer.amount
+        transfer.status = TransferStatus.FAILED
+        transaction.status = TransactionStatus.FAILED
+        await self._commit_entries(
+            [self._entry(transaction, sender, transfer.amount, EntryDirection.CREDIT)]
+        )
+        return transaction
+
+    async def get_pending_transfers(
+        self, min_age_seconds: float, limit: int
+    ) -> List[CrossShardTransfer]:
         stmt = (
-            select(LedgerEntry)
-            .where(LedgerEntry.account_id == account_id)
-            .order_by(LedgerEntry.created_at.desc())
+            select(CrossShardTransfer)
+            .where(
+                CrossShardTransfer.status == TransferStatus.PENDING,
+                CrossShardTransfer.created_at
+                < func.now() - timedelta(seconds=min_age_seconds),
+            )
+            .order_by(CrossShardTransfer.created_at)
             .limit(limit)
-            .offset(offset)
         )
         result = await self.db.execute(stmt)
         return result.scalars().all()
+
+    async def _find_by_idempotency_key(self, idempotency_key: str) -> Optional[Transaction]:
+        stmt = select(Transaction).where(Transaction.idempotency_key == idempotency_key)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def _lock_accounts(self, account_ids: List[UUID]) -> Dict[UUID, Account]:
+        # Sort to prevent deadlocks
+        account_ids = sorted(account_ids)
+
+        # Select FOR UPDATE
+        # We fetch accounts in a loop or single query. Single query is better.
+        # populate_existing: objects kept across an earlier commit in this session
+        # must not shadow what the lock just read.
+        stmt = (
+            select(Account)
+            .where(Account.id.in_(account_ids))
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self._execute_locking(stmt, account_ids)
+        return {acc.id: acc for acc in result.scalars().all()}
+
+    async def _execute_locking(self, stmt, account_ids: List[UUID], params=None):
+        """Run a statement that row-locks accounts, failing fast if they're contended."""
+        # Bound the wait on a hot row so a pile-up fails fast instead of pinning
+        # pooled connections. set_config(..., true) is SET LOCAL with a bind param.
+        await self.db.execute(
+            text("SELECT set_config('lock_timeout', :timeout, true)"),
+            {"timeout": f"{settings.LOCK_TIMEOUT_MS}ms"},
+        )
+        try:
+            return await self.db.execute(stmt, params)
+        except DBAPIError as e:
+            if _sqlstate(e) != LOCK_NOT_AVAILABLE:
+                raise
+            await self.db.rollback()
+            raise AccountBusyException(
+                f"Timed out waiting for lock on accounts {account_ids}"
+            )
+
+    async def _lock_transfer(self, transfer_id: UUID) -> CrossShardTransfer:
+        result = await self.db.execute(
+            select(CrossShardTransfer)
+            .where(CrossShardTransfer.id == transfer_id)
+            .with_for_update()
+        )
+        return result.scalar_one()
+
+    async def _commit_entries(self, entries: List[LedgerEntry]) -> None:
+        self.db.add_all(entries)
+        await self.db.flush()
+        await apply_rollups(self.db, entries)
+        # Publish to the change feed; NOTIFY is only delivered on commit
+        await publish_entries(self.db, entries)
+        await self.db.commit()
+
+    async def reserve(self, account_id: UUID, hold_in: HoldCreate) -> Hold:
+        # A single conditional UPDATE both checks and reserves available funds,
+        # so the account row is locked for one statement rather than a
+        # read-check-write round trip.
+        stmt = (
+            update(Account)
+            .where(
+                Account.id == account_id,
+                Account.balance - Account.reserved >= hold_in.amount,
+            )
+            .values(reserved=Account.reserved + hold_in.amount)
+            .returning(Account.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._execute_locking(stmt, [account_id])
+        if result.scalar_one_or_none() is None:
+            await self.db.rollback()
+            account = await self.get_account(account_id)
+            raise InsufficientFundsException(
+                f"Insufficient funds for hold. Available: {account.available_balance}"
+            )
+
+        # expires_at is computed by the server, which eager_defaults doesn't fetch
+        # back, so insert through RETURNING to load it with the rest of the row.
+        hold = await self.db.scalar(
+            insert(Hold)
+            .values(
+                account_id=account_id,
+                amount=hold_in.amount,
+                reference=hold_in.reference,
+                expires_at=func.now() + timedelta(seconds=hold_in.expires_in_seconds),
+            )
+            .returning(Hold)
+        )
+        await self.db.commit()
+        return hold
+
+    async def get_hold(self, account_id: UUID, hold_id: UUID) -> Hold:
+        result = await self.db.execute(
+            select(Hold).where(Hold.id == hold_id, Hold.account_id == account_id)
+        )
+        hold = result.scalar_one_or_none()
+        if not hold:
+            raise HoldNotFoundException(f"Hold {hold_id} not found")
+        return hold
+
+    async def capture_hold(
+        self, account_id: UUID, hold_id: UUID, amount: Optional[Decimal] = None
+    ) -> Hold:
+        """Capture all or part of an active hold. Any remainder is released."""
+        hold = await self._lock_active_hold(account_id, hold_id)
+        captured = hold.amount if amount is None else amount
+        if captured > hold.amount:
+            raise InvalidTransactionException(
+                f"Capture of {captured} exceeds hold amount {hold.amount}"
+            )
+
+        accounts_map = await self._lock_accounts([account_id])
+        account = accounts_map[account_id]
+        # Covered by the reservation, so this can't overdraw the account
+        account.reserved -= hold.amount
+        account.balance -= captured
+
+        transaction = Transaction(
+            type=TransactionType.WITHDRAWAL,
+            status=TransactionStatus.COMPLETED,
+            reference=hold.reference,
+        )
+        self.db.add(transaction)
+        await self.db.flush()
+
+        hold.status = HoldStatus.CAPTURED
+        hold.captured_amount = captured
+        hold.transaction_id = transaction.id
+        await self._commit_entries(
+            [self._entry(transaction, account, -captured, EntryDirection.DEBIT)]
+        )
+        return hold
+
+    async def release_hold(self, account_id: UUID, hold_id: UUID) -> Hold:
+        hold = await self._lock_active_hold(account_id, hold_id)
+        hold.status = HoldStatus.RELEASED
+        await self._execute_locking(
+            update(Account)
+            .where(Account.id == account_id)
+            .values(reserved=Account.reserved - hold.amount)
+            .execution_options(synchronize_session=False),
+            [account_id],
+        )
+        await self.db.commit()
+        return hold
+
+    async def expire_holds(self, limit: int) -> int:
+        """Expire one batch of overdue holds, returning how many were expired."""
+        # SKIP LOCKED lets several workers sweep without queueing on each other
+        # or on a capture/release in progress.
+        result = await self._execute_locking(EXPIRE_HOLDS, [], {"limit": limit})
+        expired = result.scalar_one()
+        await self.db.commit()
+        return expired
+
+    async def _lock_active_hold(self, account_id: UUID, hold_id: UUID) -> Hold:
+        # Expiry is judged by the database clock, the same one the sweeper uses
+        stmt = (
+            select(Hold, (Hold.expires_at <= func.now()).label("overdue"))
+            .where(Hold.id == hold_id, Hold.account_id == account_id)
+            .with_for_update(of=Hold)
+        )
+        row = (await self._execute_locking(stmt, [account_id])).one_or_none()
+        if not row:
+            raise HoldNotFoundException(f"Hold {hold_id} not found")
+        hold, overdue = row
+        if hold.status != HoldStatus.ACTIVE:
+            raise InvalidTransactionException(f"Hold {hold_id} is {hold.status.value}")
+        if overdue:
+            # Overdue, the sweeper just hasn't reached it yet
+            raise InvalidTransactionException(f"Hold {hold_id} has expired")
+        return hold
+
+    def _entry(
+        self,
+        transaction: Transaction,
+        account: Account,
+        amount: Decimal,
+        direction: EntryDirection,
+    ) -> LedgerEntry:
+        # Caller must hold the account row lock: seq is allocated from the locked row.
+        account.last_entry_seq += 1
+        return LedgerEntry(
+            transaction_id=transaction.id,
+            account_id=account.id,
+            amount=amount,
+            direction=direction,
+            seq=account.last_entry_seq,
+            balance_after=account.balance,
+        )
+
+    async def get_account_history(
+        self,
+        account_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after_seq: Optional[int] = None,
+    ):
+        stmt = select(LedgerEntry).where(LedgerEntry.account_id == account_id)
+        if after_seq is not None:
+            # Incremental sync: oldest first, so the last seq returned is the next cursor.
+            stmt = stmt.where(LedgerEntry.seq > after_seq).order_by(LedgerEntry.seq.asc())
+        else:
+            stmt = stmt.order_by(LedgerEntry.seq.desc()).offset(offset)
+        result = await self.db.execute(stmt.limit(limit))
+        return result.scalars().all()
@@ -0,0 +1,75 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.ledger_entry import LedgerEntry
+
+_UPSERT_SET = """
+        credits = r.credits + EXCLUDED.credits,
+        debits = r.debits + EXCLUDED.debits,
+        entry_count = r.entry_count + EXCLUDED.entry_count,
+        closing_balance = CASE
+            WHEN EXCLUDED.last_seq > r.last_seq
+            THEN EXCLUDED.closing_balance ELSE r.closing_balance END,
+        last_seq = greatest(r.last_seq, EXCLUDED.last_seq)
+"""
+
+# Day and month rows are bumped in one round trip. The period comes from now(),
+# the transaction start, which is also every new entry's created_at, so rollups
+# reconcile exactly with entries grouped by date even across midnight. Postings
+# that started before midnight can commit after ones that started later; the
+# last_seq guard above keeps each period's closing balance at its highest seq.
+APPLY_ROLLUPS = text(
+    f"""
+    WITH deltas AS (
+        SELECT * FROM unnest(
+            CAST(:account_ids AS uuid[]),
+            CAST(:credits AS numeric[]),
+            CAST(:debits AS numeric[]),
+            CAST(:entry_counts AS integer[]),
+            CAST(:closing_balances AS numeric[]),
+            CAST(:last_seqs AS bigint[])
+        ) AS d(account_id, credits, debits, entry_count, closing_balance, last_seq)
+    ), daily AS (
+        INSERT INTO account_daily_rollups AS r
+            (account_id, day, credits, debits, entry_count, closing_balance, last_seq)
+        SELECT account_id, (now() AT TIME ZONE 'UTC')::date,
+               credits, debits, entry_count, closing_balance, last_seq
+        FROM deltas
+        ON CONFLICT (account_id, day) DO UPDATE SET {_UPSERT_SET}
+    )
+    INSERT INTO account_monthly_rollups AS r
+        (account_id, month, credits, debits, entry_count, closing_balance, last_seq)
+    SELECT account_id,
+           date_trunc('month', now() AT TIME ZONE 'UTC')::date,
+           credits, debits, entry_count, closing_balance, last_seq
+    FROM deltas
+    ON CONFLICT (account_id, month) DO UPDATE SET {_UPSERT_SET}
+    """
+)
+
+
+async def apply_rollups(db: AsyncSession, entries: List[LedgerEntry]) -> None:
+    """Fold entries into their accounts' rollups. Callers hold the account locks."""
+    # One row per account: ON CONFLICT can't touch the same row twice in a statement
+    by_account = defaultdict(list)
+    for entry in entries:
+        by_account[entry.account_id].append(entry)
+
+    params = defaultdict(list)
+    for account_id, account_entries in by_account.items():
+        latest = max(account_entries, key=lambda entry: entry.seq)
+        params["account_ids"].append(account_id)
+        params["credits"].append(
+            sum((e.amount for e in account_entries if e.amount > 0), Decimal(0))
+        )
+        params["debits"].append(
+            sum((-e.amount for e in account_entries if e.amount < 0), Decimal(0))
+        )
+        params["entry_counts"].append(len(account_entries))
+        params["closing_balances"].append(latest.balance_after)
+        params["last_seqs"].append(latest.seq)
+    await db.execute(APPLY_ROLLUPS, dict(params))
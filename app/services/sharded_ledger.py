@@ -0,0 +1,286 @@
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from operator import attrgetter
+from typing import Awaitable, Callable, List, Optional, Tuple
+from uuid import UUID
+
+from app.core.config import settings
+from app.core.exceptions import (
+    AccountNotFoundException,
+    TransactionNotFoundException,
+)
+from app.core.sharding import ShardRouter, shard_router
+from app.models.account import Account
+from app.models.hold import Hold
+from app.models.transaction import Transaction, TransactionStatus, TransactionType
+from app.models.transfer import CrossShardTransfer, TransferStatus
+from app.schemas.account import AccountCreate
+from app.schemas.hold import HoldCreate
+from app.schemas.summary import Granularity
+from app.schemas.transaction import TransactionCreate
+from app.services.ledger import LedgerService
+
+logger = logging.getLogger(__name__)
+
+
+class ShardedLedgerService:
+    """
+    Routes LedgerService operations to the shard that owns each account.
+
+    Anything touching a single shard runs exactly as before. A transfer between
+    shards runs as two local transactions: the sender is debited alongside a
+    PENDING transfer record on its shard, then the receiver is credited on its
+    own, keyed on the transfer ID. If we crash in between, the PENDING record
+    stays behind for the sweeper to finish.
+    """
+
+    def __init__(self, router: ShardRouter):
+        self.router = router
+
+    async def create_account(self, account_in: AccountCreate) -> Account:
+        # The ID decides the shard, so it's assigned before the insert
+        account_id = uuid.uuid4()
+        async with self.router.session_for(account_id) as db:
+            return await LedgerService(db).create_account(account_in, account_id)
+
+    async def get_account(self, account_id: UUID) -> Account:
+        async with self.router.session_for(account_id) as db:
+            return await LedgerService(db).get_account(account_id)
+
+    async def get_accounts(self, account_ids: List[UUID]) -> List[Account]:
+        by_shard = defaultdict(list)
+        for account_id in account_ids:
+            by_shard[self.router.shard_for(account_id)].append(account_id)
+
+        async def fetch(shard, ids):
+            async with self.router.session(shard) as db:
+                return await LedgerService(db).get_accounts(ids)
+
+        results = await asyncio.gather(
+            *(fetch(shard, ids) for shard, ids in by_shard.items())
+        )
+        return [account for accounts in results for account in accounts]
+
+    async def list_accounts(
+        self,
+        currency: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        min_balance: Optional[Decimal] = None,
+        max_balance: Optional[Decimal] = None,
+        after: Optional[UUID] = None,
+        limit: int = 100,
+    ) -> List[Account]:
+        # Every shard returns its own first `limit` rows after the cursor; the
+        # global page is the smallest `limit` keys among them.
+        after_name = None
+        if name_prefix and after:
+            # Name-ordered pages continue from (name, id), but only the cursor
+            # account's own shard knows its name.
+            after_name = (await self.get_account(after)).name
+
+        async def fetch(shard):
+            async with self.router.session(shard) as db:
+                return await LedgerService(db).list_accounts(
+                    currency,
+                    name_prefix,
+                    min_balance,
+                    max_balance,
+                    after,
+                    limit,
+                    after_name,
+                )
+
+        results = await asyncio.gather(
+            *(fetch(shard) for shard in range(self.router.shard_count))
+        )
+        # Python compares names by code point: the C collation's order for UTF-8
+        key = attrgetter("name", "id") if name_prefix else attrgetter("id")
+        merged = sorted(
+            (account for accounts in results for account in accounts), key=key
+        )
+        return merged[:limit]
+
+    async def get_account_history(
+        self,
+        account_id: UUID,
+        limit: int = 100,
+        offset: int = 0,
+        after_seq: Optional[int] = None,
+    ):
+        async with self.router.session_for(account_id) as db:
+            return await LedgerService(db).get_account_history(
+                account_id, limit, offset, after_seq
+            )
+
+    async def get_summary(
+        self, account_id: UUID, granularity: Granularity, start: date, end: date
+    ) -> List[dict]:
+        async with self.router.session_for(account_id) as db:
+            return await LedgerService(db).get_summary(
+                account_id, granularity, start, end
+            )
+
+    async def search_transactions(
+        self,
+        reference: Optional[str] = None,
+        reference_prefix: Optional[str] = None,
+        tx_type: Optional[TransactionType] = None,
+        tx_status: Optional[TransactionStatus] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = 100,
+    ) -> List[Transaction]:
+        # Same merge as list_accounts, newest first on (created_at, id)
+        async def fetch(shard):
+            async with self.router.session(shard) as db:
+                return await LedgerService(db).search_transactions(
+                    reference,
+                    reference_prefix,
+                    tx_type,
+                    tx_status,
+                    start,
+                    end,
+                    after,
+                    limit,
+                )
+
+        results = await asyncio.gather(
+            *(fetch(shard) for shard in range(self.router.shard_count))
+        )
+        merged = sorted(
+            (tx for transactions in results for tx in transactions),
+            key=lambda tx: (tx.created_at, tx.id),
+            reverse=True,
+        )
+        return merged[:limit]
+
+    async def get_transaction(self, transaction_id: UUID) -> Transaction:
+        # Transaction IDs don't encode a shard, so ask them all at once
+        async def fetch(shard):
+            async with self.router.session(shard) as db:
+                try:
+                    return await LedgerService(db).get_transaction(transaction_id)
+                except TransactionNotFoundException:
+                    return None
+
+        results = await asyncio.gather(
+            *(fetch(shard) for shard in range(self.router.shard_count))
+        )
+        for transaction in results:
+            if transaction is not None:
+                return transaction
+        raise TransactionNotFoundException(f"Transaction {transaction_id} not found")
+
+    async def process_transaction(
+        self, tx_in: TransactionCreate, idempotency_key: str = None
+    ) -> Transaction:
+        sender_shard = self.router.shard_for(tx_in.account_id)
+        if (
+            tx_in.type != TransactionType.TRANSFER
+            or self.router.shard_for(tx_in.receiver_id) == sender_shard
+        ):
+            async with self.router.session(sender_shard) as db:
+                return await LedgerService(db).process_transaction(
+                    tx_in, idempotency_key
+                )
+
+        # Accounts are never deleted, so checking up front keeps a typo'd receiver
+        # from costing a debit and a compensating refund.
+        try:
+            await self.get_account(tx_in.receiver_id)
+        except AccountNotFoundException:
+            raise AccountNotFoundException(
+                f"Receiver account {tx_in.receiver_id} not found"
+            )
+
+        async with self.router.session(sender_shard) as db:
+            transaction, transfer = await LedgerService(db).begin_transfer(
+                tx_in, idempotency_key
+            )
+        if transfer is None or transfer.status != TransferStatus.PENDING:
+            return transaction
+        # Still PENDING if settling fails here; the sweeper finishes it.
+        return await self._settle(sender_shard, transfer) or transaction
+
+    async def _settle(
+        self, sender_shard: int, transfer: CrossShardTransfer
+    ) -> Optional[Transaction]:
+        try:
+            async with self.router.session_for(transfer.receiver_id) as db:
+                await LedgerService(db).receive_transfer(transfer)
+        except AccountNotFoundException:
+            async with self.router.session(sender_shard) as db:
+                return await LedgerService(db).fail_transfer(transfer.id)
+        except Exception:
+            logger.exception("Cross-shard transfer %s left pending", transfer.id)
+            return None
+
+        async with self.router.session(sender_shard) as db:
+            return await LedgerService(db).complete_transfer(transfer.id)
+
+    async def sweep_transfers(self) -> int:
+        """Finish transfers that have been PENDING too long. Returns how many were retried."""
+        retried = 0
+        for shard in range(self.router.shard_count):
+            async with self.router.session(shard) as db:
+                pending = await LedgerService(db).get_pending_transfers(
+                    settings.TRANSFER_SWEEP_MIN_AGE_SECONDS,
+                    settings.TRANSFER_SWEEP_BATCH,
+                )
+            for transfer in pending:
+                await self._settle(shard, transfer)
+                retried += 1
+        return retried
+
+    async def reserve(self, account_id: UUID, hold_in: HoldCreate) -> Hold:
+        async with self.router.session_for(account_id) as db:
+            return await LedgerService(db).reserve(account_id, hold_in)
+
+    async def get_hold(self, account_id: UUID, hold_id: UUID) -> Hold:
+        async with self.router.session_for(account_id) as db:
+            return await LedgerService(db).get_hold(account_id, hold_id)
+
+    async def capture_hold(
+        self, account_id: UUID, hold_id: UUID, amount: Optional[Decimal] = None
+    ) -> Hold:
+        async with self.router.session_for(account_id) as db:
+            return await LedgerService(db).capture_hold(account_id, hold_id, amount)
+
+    async def release_hold(self, account_id: UUID, hold_id: UUID) -> Hold:
+        async with self.router.session_for(account_id) as db:
+            return await LedgerService(db).release_hold(account_id, hold_id)
+
+    async def expire_holds(self) -> int:
+        """Expire overdue holds on every shard, batch by batch. Returns how many."""
+        expired = 0
+        for shard in range(self.router.shard_count):
+            while True:
+                async with self.router.session(shard) as db:
+                    count = await LedgerService(db).expire_holds(
+                        settings.HOLD_SWEEP_BATCH
+                    )
+                expired += count
+                if count < settings.HOLD_SWEEP_BATCH:
+                    break
+        return expired
+
+
+async def run_forever(job: Callable[[], Awaitable], interval: float) -> None:
+    """Background loop for the sweepers: a failed run is logged and retried next tick."""
+    while True:
+        try:
+            await job()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Background job %s failed", job.__name__)
+        await asyncio.sleep(interval)
+
+
+def get_ledger() -> ShardedLedgerService:
+    return ShardedLedgerService(shard_router)
@@ -55,10 +55,17 @@ async def clear_db(db_session):
     from sqlalchemy import delete
 
     from app.models.account import Account
+    from app.models.hold import Hold
     from app.models.ledger_entry import LedgerEntry
+    from app.models.rollup import AccountDailyRollup, AccountMonthlyRollup
     from app.models.transaction import Transaction
+    from app.models.transfer import CrossShardTransfer
 
     await db_session.execute(delete(LedgerEntry))
+    await db_session.execute(delete(AccountDailyRollup))
+    await db_session.execute(delete(AccountMonthlyRollup))
+    await db_session.execute(delete(Hold))
+    await db_session.execute(delete(CrossShardTransfer))
     await db_session.execute(delete(Transaction))
     await db_session.execute(delete(Account))
     await db_session.commit()
@@ -0,0 +1,19 @@
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from tests.plans.seed import PLAN_TEST_DATABASE_URL, seed
+
+
+@pytest_asyncio.fixture(scope="session")
+async def plan_engine():
+    engine = create_async_engine(PLAN_TEST_DATABASE_URL, echo=False, poolclass=NullPool)
+    await seed(engine)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_db():
+    # Overrides the suite-wide fixture: the seeded dataset must survive between tests.
+    yield
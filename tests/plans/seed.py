@@ -0,0 +1,203 @@
+"""Synthetic dataset for the query-plan tier, generated server-side with generate_series."""
+
+import asyncio
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Tuple
+
+from sqlalchemy import text
+
+from alembic import command
+from alembic.config import Config
+
+# Seeding millions of rows takes minutes, so this tier runs against its own
+# database and only when pointed at one explicitly.
+PLAN_TEST_DATABASE_URL = os.getenv("PLAN_TEST_DATABASE_URL")
+PLAN_TEST_ACCOUNTS = int(os.getenv("PLAN_TEST_ACCOUNTS", "1000000"))
+PLAN_TEST_ENTRIES = int(os.getenv("PLAN_TEST_ENTRIES", "5000000"))
+PLAN_TEST_HOLDS = int(os.getenv("PLAN_TEST_HOLDS", "200000"))
+
+ALEMBIC_DIR = Path(__file__).resolve().parents[2] / "alembic"
+
+
+def seeded_account_id(i: int) -> uuid.UUID:
+    # Matches md5('acct' || i)::uuid in the seed SQL
+    return uuid.UUID(hashlib.md5(f"acct{i}".encode()).hexdigest())
+
+
+def seeded_tx_id(i: int) -> uuid.UUID:
+    # Matches md5('tx' || i)::uuid in the seed SQL
+    return uuid.UUID(hashlib.md5(f"tx{i}".encode()).hexdigest())
+
+
+def seeded_hold(i: int) -> Tuple[uuid.UUID, uuid.UUID]:
+    # (account_id, hold_id) of hold i in the seed SQL; every tenth is RELEASED
+    account = i * 7919 % PLAN_TEST_ACCOUNTS
+    return seeded_account_id(account), uuid.UUID(hashlib.md5(f"hold{i}".encode()).hexdigest())
+
+
+# Entries land on account floor(N * random()^3): a power-law skew where account 0
+# is the hottest and most of the tail has few or no entries.
+SEED_SQL = [
+    "SET synchronous_commit = off",
+    """
+    INSERT INTO accounts (id, name, currency, balance, last_entry_seq, created_at)
+    SELECT md5('acct' || i)::uuid,
+           'account-' || lpad(i::text, 8, '0'),
+           CASE WHEN i % 4 = 0 THEN 'INR' ELSE 'USD' END,
+           0, 0,
+           now() - make_interval(secs => CAST(:accounts AS bigint) - i)
+    FROM generate_series(0, CAST(:accounts AS bigint) - 1) AS i
+    """,
+    """
+    INSERT INTO transactions (id, type, status, reference, created_at)
+    SELECT md5('tx' || i)::uuid,
+           'DEPOSIT'::transactiontype,
+           'COMPLETED'::transactionstatus,
+           'ref-' || lpad(i::text, 10, '0'),
+           now() - make_interval(secs => CAST(:entries AS bigint) - i)
+    FROM generate_series(0, CAST(:entries AS bigint) - 1) AS i
+    """,
+    """
+    INSERT INTO ledger_entries
+        (id, transaction_id, account_id, amount, direction, seq, balance_after, created_at)
+    SELECT md5('le' || i)::uuid,
+           md5('tx' || i)::uuid,
+           account_id,
+           amount,
+           'CREDIT'::entrydirection,
+           row_number() OVER w,
+           sum(amount) OVER w,
+           created_at
+    FROM (
+        SELECT i,
+               md5('acct' || floor(CAST(:accounts AS bigint) * random() ^ 3)::bigint)::uuid AS account_id,
+               round((random() * 100 + 1)::numeric, 2) AS amount,
+               now() - make_interval(secs => CAST(:entries AS bigint) - i) AS created_at
+        FROM generate_series(0, CAST(:entries AS bigint) - 1) AS i
+    ) AS generated
+    WINDOW w AS (PARTITION BY account_id ORDER BY i ROWS UNBOUNDED PRECEDING)
+    """,
+    """
+    UPDATE accounts AS a
+    SET balance = totals.balance, last_entry_seq = totals.last_seq
+    FROM (
+        SELECT account_id, sum(amount) AS balance, max(seq) AS last_seq
+        FROM ledger_entries
+        GROUP BY account_id
+    ) AS totals
+    WHERE a.id = totals.account_id
+    """,
+    # Spread over many accounts, none overdue: the sweeper's index scan finds
+    # nothing to do, the way it usually does.
+    """
+    INSERT INTO holds (id, account_id, amount, status, expires_at, created_at)
+    SELECT md5('hold' || i)::uuid,
+           md5('acct' || (i * 7919 % CAST(:accounts AS bigint)))::uuid,
+           1.00,
+           CASE WHEN i % 10 = 0 THEN 'RELEASED' ELSE 'ACTIVE' END::holdstatus,
+           now() + make_interval(days => CAST(1 + i % 30 AS int)),
+           now()
+    FROM generate_series(1, CAST(:holds AS bigint)) AS i
+    """,
+    """
+    UPDATE accounts AS a
+    SET reserved = held.total
+    FROM (
+        SELECT account_id, sum(amount) AS total
+        FROM holds
+        WHERE status = 'ACTIVE'
+        GROUP BY account_id
+    ) AS held
+    WHERE a.id = held.account_id
+    """,
+]
+
+# Same aggregation as the rollup backfill migration
+SEED_SQL += [
+    f"""
+    INSERT INTO {table}
+        (account_id, {period}, credits, debits, entry_count, closing_balance, last_seq)
+    SELECT account_id,
+           {period_expr},
+           coalesce(sum(amount) FILTER (WHERE amount > 0), 0),
+           coalesce(-sum(amount) FILTER (WHERE amount < 0), 0),
+           count(*),
+           (array_agg(balance_after ORDER BY seq DESC))[1],
+           max(seq)
+    FROM ledger_entries
+    GROUP BY account_id, {period_expr}
+    """
+    for table, period, period_expr in (
+        ("account_daily_rollups", "day", "(created_at AT TIME ZONE 'UTC')::date"),
+        (
+            "account_monthly_rollups",
+            "month",
+            "date_trunc('month', created_at AT TIME ZONE 'UTC')::date",
+        ),
+    )
+]
+
+
+def fingerprint() -> str:
+    # Changes whenever a migration or the dataset size does
+    digest = hashlib.sha1()
+    for path in sorted((ALEMBIC_DIR / "versions").glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    digest.update(f"{PLAN_TEST_ACCOUNTS}|{PLAN_TEST_ENTRIES}|{PLAN_TEST_HOLDS}".encode())
+    return digest.hexdigest()
+
+
+def _alembic_config() -> Config:
+    config = Config(str(ALEMBIC_DIR.parent / "alembic.ini"))
+    config.set_main_option("script_location", str(ALEMBIC_DIR))
+    config.attributes["database_urls"] = [PLAN_TEST_DATABASE_URL]
+    return config
+
+
+async def is_seeded(conn, expected: str) -> bool:
+    try:
+        seeded = await conn.scalar(text("SELECT fingerprint FROM plan_seed_info"))
+    except Exception:
+        return False
+    return seeded == expected
+
+
+async def seed(engine) -> None:
+    # Reuse the dataset across runs; it only changes when the schema or sizes do.
+    # Taken before migrating, so a migration edited mid-seed forces a reseed.
+    expected = fingerprint()
+    async with engine.connect() as conn:
+        if await is_seeded(conn, expected):
+            return
+
+    async with engine.begin() as conn:
+        # Enum types and alembic_version go too
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+    # Build the schema through the migrations production runs, not the models,
+    # so an index declared on a model but missing from its migration fails here.
+    # env.py starts its own event loop, hence the thread.
+    await asyncio.get_running_loop().run_in_executor(
+        None, command.upgrade, _alembic_config(), "head"
+    )
+
+    async with engine.begin() as conn:
+        params = {
+            "accounts": PLAN_TEST_ACCOUNTS,
+            "entries": PLAN_TEST_ENTRIES,
+            "holds": PLAN_TEST_HOLDS,
+        }
+        for statement in SEED_SQL:
+            await conn.execute(text(statement), params)
+        await conn.execute(text("CREATE TABLE plan_seed_info (fingerprint text NOT NULL)"))
+        await conn.execute(
+            text("INSERT INTO plan_seed_info VALUES (:fingerprint)"),
+            {"fingerprint": expected},
+        )
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE"))
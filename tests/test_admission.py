@@ -0,0 +1,56 @@
+import asyncio
+import uuid
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.admission import AdmissionController
+from app.core.exceptions import AccountBusyException, ServiceOverloadedException
+
+
+@pytest.mark.asyncio
+async def test_hot_account_fails_fast_without_blocking_others():
+    controller = AdmissionController(
+        max_inflight=4, max_inflight_per_account=1, max_queued_per_account=1, timeout=0.2
+    )
+    hot, cold = uuid.uuid4(), uuid.uuid4()
+
+    async with controller.admit([hot]):
+        # One request may queue behind the in-flight one...
+        queued = asyncio.create_task(controller.admit([hot]).__aenter__())
+        await asyncio.sleep(0)
+        assert controller.snapshot()["hot_accounts"][0]["queued"] == 1
+
+        # ...the next one is rejected immediately
+        with pytest.raises(AccountBusyException):
+            async with controller.admit([hot]):
+                pass
+
+        # Unrelated accounts are still admitted
+        async with controller.admit([cold]):
+            assert controller.snapshot()["inflight"] == 2
+
+        with pytest.raises(AccountBusyException):
+            await queued
+
+    # Slots are dropped once an account goes idle
+    assert controller.snapshot()["hot_accounts"] == []
+
+
+@pytest.mark.asyncio
+async def test_global_cap_returns_overloaded():
+    controller = AdmissionController(
+        max_inflight=1, max_inflight_per_account=1, max_queued_per_account=1, timeout=0.1
+    )
+    async with controller.admit([uuid.uuid4()]):
+        with pytest.raises(ServiceOverloadedException):
+            async with controller.admit([uuid.uuid4()]):
+                pass
+    assert controller.snapshot()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_admission_status_endpoint(client: AsyncClient):
+    response = await client.get("/health/admission")
+    assert response.status_code == 200
+    assert response.json()["inflight"] == 0
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.api.v1.endpoints.feed import stream_entries
+from app.core.database import engine
+from app.services.change_feed import ChangeFeed, change_feed
+
+
+def _event(account_id, seq):
+    return {"account_id": str(account_id), "seq": seq}
+
+
+@pytest.mark.asyncio
+async def test_fan_out_to_account_and_global_subscribers():
+    feed = ChangeFeed(dsns=[], queue_size=10)
+    a, b = uuid.uuid4(), uuid.uuid4()
+    sub_a = feed.subscribe(a)
+    sub_all = feed.subscribe()
+
+    feed._dispatch(_event(a, 1))
+    feed._dispatch(_event(b, 1))
+
+    assert sub_a.queue.qsize() == 1
+    assert (await sub_a.queue.get())["seq"] == 1
+    assert sub_all.queue.qsize() == 2
+
+    feed.unsubscribe(sub_a)
+    feed._dispatch(_event(a, 2))
+    assert sub_a.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_ended_not_blocking():
+    feed = ChangeFeed(dsns=[], queue_size=1)
+    account_id = uuid.uuid4()
+    slow = feed.subscribe(account_id)
+
+    feed._dispatch(_event(account_id, 1))
+    feed._dispatch(_event(account_id, 2))  # Queue full: subscriber is dropped
+
+    assert slow.overflowed
+    feed._dispatch(_event(account_id, 3))
+    assert slow.queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_listener_loss_ends_streams():
+    feed = ChangeFeed(dsns=[], queue_size=10)
+    sub = feed.subscribe(uuid.uuid4())
+
+    feed._end_all()
+
+    assert sub.overflowed
+    assert await sub.queue.get() is None
+
+
+class _ConnectedRequest:
+    # Stands in for the Starlette request: the client never disconnects
+    async def is_disconnected(self):
+        return False
+
+
+def _seq(chunk: str) -> int:
+    fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+    data = json.loads(fields["data"])
+    assert fields["id"] == str(data["seq"])
+    return data["seq"]
+
+
+async def _next_seqs(stream, count):
+    return [_seq(await asyncio.wait_for(stream.__anext__(), 5)) for _ in range(count)]
+
+
+ENTRY_EVENT_KEYS = (
+    "id",
+    "transaction_id",
+    "account_id",
+    "amount",
+    "direction",
+    "seq",
+    "balance_after",
+)
+
+
+def _live_event(entry):
+    # What the LISTEN connection would hand to the feed for this entry
+    return {key: entry[key] for key in ENTRY_EVENT_KEYS}
+
+
+@pytest.mark.asyncio
+async def test_feed_resumes_without_gaps_or_duplicates(client: AsyncClient):
+    account_id = (
+        await client.post("/api/v1/accounts/", json={"name": "Feed User", "currency": "USD"})
+    ).json()["id"]
+
+    async def deposit():
+        res = await client.post(
+            "/api/v1/transactions/",
+            json={"account_id": account_id, "type": "DEPOSIT", "amount": 10},
+        )
+        assert res.status_code == 201
+
+    for _ in range(3):
+        await deposit()
+
+    # 1. Resume after seq 1: entries 2 and 3 are replayed from the ledger
+    response = await stream_entries(
+        _ConnectedRequest(), account_id=uuid.UUID(account_id), after_seq=1, last_event_id=None
+    )
+    stream = response.body_iterator
+    try:
+        assert await _next_seqs(stream, 2) == [2, 3]
+
+        # 2. Live events overlapping the backfill are dropped, new ones delivered
+        await deposit()
+        history = (
+            await client.get(f"/api/v1/accounts/{account_id}/history", params={"after_seq": 2})
+        ).json()
+        for entry in history:  # seq 3 (already sent) and seq 4
+            change_feed._dispatch(_live_event(entry))
+        assert await _next_seqs(stream, 1) == [4]
+    finally:
+        await stream.aclose()
+
+    # 3. A reconnecting browser sends Last-Event-ID instead of after_seq
+    response = await stream_entries(
+        _ConnectedRequest(), account_id=uuid.UUID(account_id), after_seq=None, last_event_id="2"
+    )
+    stream = response.body_iterator
+    try:
+        assert await _next_seqs(stream, 2) == [3, 4]
+    finally:
+        await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_global_feed_cannot_resume(client: AsyncClient):
+    res = await client.get("/api/v1/feed/", params={"after_seq": 1})
+    assert res.status_code == 400
+    res = await client.get("/api/v1/feed/", headers={"Last-Event-ID": "5"})
+    assert res.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_live_and_replayed_events_match(client: AsyncClient):
+    account_id = (
+        await client.post("/api/v1/accounts/", json={"name": "Feed User", "currency": "USD"})
+    ).json()["id"]
+
+    notified = []
+
+    def on_statement(conn, cursor, statement, parameters, context, executemany):
+        if "pg_notify" in statement:
+            notified.extend(json.loads(payload) for payload in parameters[-1])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_statement)
+    try:
+        # Amount as entered, without the column's two decimal places
+        res = await client.post(
+            "/api/v1/transactions/",
+            json={"account_id": account_id, "type": "DEPOSIT", "amount": "5"},
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_statement)
+    assert res.status_code == 201
+
+    response = await stream_entries(
+        _ConnectedRequest(), account_id=uuid.UUID(account_id), after_seq=0, last_event_id=None
+    )
+    stream = response.body_iterator
+    try:
+        chunk = await asyncio.wait_for(stream.__anext__(), 5)
+    finally:
+        await stream.aclose()
+    fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+    replayed = json.loads(fields["data"])
+
+    assert notified == [replayed]
+    assert replayed["amount"] == replayed["balance_after"] == "5.00"
@@ -0,0 +1,53 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.database import connect_args, engine
+
+
+def test_pgbouncer_mode_disables_prepared_statement_reuse(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER", False)
+    assert connect_args() == {
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+    }
+
+    monkeypatch.setattr(settings, "DB_PGBOUNCER", True)
+    args = connect_args()
+    assert args["statement_cache_size"] == 0
+    assert args["prepared_statement_cache_size"] == 0
+    # Names must not collide across server connections
+    name_func = args["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+@pytest.mark.asyncio
+async def test_transaction_makes_no_round_trips_after_commit(client: AsyncClient):
+    account_id = (
+        await client.post("/api/v1/accounts/", json={"name": "Trip User", "currency": "USD"})
+    ).json()["id"]
+
+    log = []
+
+    def on_statement(conn, cursor, statement, parameters, context, executemany):
+        log.append(statement)
+
+    def on_commit(conn):
+        log.append("COMMIT")
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_statement)
+    event.listen(engine.sync_engine, "commit", on_commit)
+    try:
+        res = await client.post(
+            "/api/v1/transactions/",
+            json={"account_id": account_id, "type": "DEPOSIT", "amount": 10},
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_statement)
+        event.remove(engine.sync_engine, "commit", on_commit)
+
+    # The response is built from what the transaction itself wrote and returned
+    assert res.status_code == 201
+    assert res.json()["created_at"]
+    assert log[-1] == "COMMIT"
+    assert log.count("COMMIT") == 1
@@ -0,0 +1,107 @@
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, update
+
+from app.models.hold import Hold
+from app.services.ledger import LedgerService
+
+
+async def _funded_account(client: AsyncClient, amount: int) -> str:
+    acc_res = await client.post(
+        "/api/v1/accounts/", json={"name": "Hold User", "currency": "USD"}
+    )
+    account_id = acc_res.json()["id"]
+    await client.post(
+        "/api/v1/transactions/",
+        json={"account_id": account_id, "type": "DEPOSIT", "amount": amount},
+    )
+    return account_id
+
+
+async def _balances(client: AsyncClient, account_id: str):
+    data = (await client.get(f"/api/v1/accounts/{account_id}")).json()
+    return float(data["balance"]), float(data["available_balance"])
+
+
+@pytest.mark.asyncio
+async def test_hold_reserves_available_balance(client: AsyncClient):
+    account_id = await _funded_account(client, 100)
+
+    # 1. Hold $70: ledger balance unchanged, available reduced
+    res = await client.post(f"/api/v1/accounts/{account_id}/holds/", json={"amount": 70})
+    assert res.status_code == 201
+    assert res.json()["status"] == "ACTIVE"
+    assert await _balances(client, account_id) == (100.0, 30.0)
+
+    # 2. Held funds can't be withdrawn or held twice
+    with_res = await client.post(
+        "/api/v1/transactions/",
+        json={"account_id": account_id, "type": "WITHDRAWAL", "amount": 50},
+    )
+    assert with_res.status_code == 400
+    res = await client.post(f"/api/v1/accounts/{account_id}/holds/", json={"amount": 31})
+    assert res.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_partial_capture_releases_remainder(client: AsyncClient):
+    account_id = await _funded_account(client, 100)
+    hold_id = (
+        await client.post(f"/api/v1/accounts/{account_id}/holds/", json={"amount": 60})
+    ).json()["id"]
+
+    res = await client.post(
+        f"/api/v1/accounts/{account_id}/holds/{hold_id}/capture", json={"amount": 45}
+    )
+    assert res.status_code == 200
+    hold = res.json()
+    assert hold["status"] == "CAPTURED"
+    assert float(hold["captured_amount"]) == 45.0
+    assert hold["transaction_id"] is not None
+    assert await _balances(client, account_id) == (55.0, 55.0)
+
+    # One capture per hold
+    res = await client.post(
+        f"/api/v1/accounts/{account_id}/holds/{hold_id}/capture", json={}
+    )
+    assert res.status_code == 409
+
+    history = (await client.get(f"/api/v1/accounts/{account_id}/history")).json()
+    assert float(history[0]["amount"]) == -45.0
+    assert float(history[0]["balance_after"]) == 55.0
+
+
+@pytest.mark.asyncio
+async def test_release_returns_funds_without_ledger_writes(client: AsyncClient):
+    account_id = await _funded_account(client, 100)
+    hold_id = (
+        await client.post(f"/api/v1/accounts/{account_id}/holds/", json={"amount": 40})
+    ).json()["id"]
+
+    res = await client.post(f"/api/v1/accounts/{account_id}/holds/{hold_id}/release")
+    assert res.status_code == 200
+    assert res.json()["status"] == "RELEASED"
+    assert await _balances(client, account_id) == (100.0, 100.0)
+
+    history = (await client.get(f"/api/v1/accounts/{account_id}/history")).json()
+    assert len(history) == 1  # Just the deposit
+
+
+@pytest.mark.asyncio
+async def test_sweeper_expires_overdue_holds(client: AsyncClient, db_session):
+    account_id = await _funded_account(client, 100)
+    hold_id = (
+        await client.post(f"/api/v1/accounts/{account_id}/holds/", json={"amount": 40})
+    ).json()["id"]
+    await db_session.execute(
+        update(Hold).where(Hold.id == uuid.UUID(hold_id)).values(expires_at=func.now())
+    )
+    await db_session.commit()
+
+    assert await LedgerService(db_session).expire_holds(limit=100) == 1
+
+    hold = (await client.get(f"/api/v1/accounts/{account_id}/holds/{hold_id}")).json()
+    assert hold["status"] == "EXPIRED"
+    assert await _balances(client, account_id) == (100.0, 100.0)
@@ -1,4 +1,5 @@
 import asyncio
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from httpx import AsyncClient
@@ -137,3 +138,234 @@ async def test_idempotency(client: AsyncClient):
     # 6. Verify Balance (Should be 50, not 0)
     bal_res = await client.get(f"/api/v1/accounts/{account_id}")
     assert float(bal_res.json()["balance"]) == 50.0
+
+
+@pytest.mark.asyncio
+async def test_entry_seq_and_running_balance(client: AsyncClient):
+    # 1. Create Accounts
+    sender_id = (
+        await client.post("/api/v1/accounts/", json={"name": "Seq Sender", "currency": "USD"})
+    ).json()["id"]
+    receiver_id = (
+        await client.post("/api/v1/accounts/", json={"name": "Seq Receiver", "currency": "USD"})
+    ).json()["id"]
+
+    # 2. Deposit $100, Withdraw $30, Transfer $50
+    for payload in [
+        {"account_id": sender_id, "type": "DEPOSIT", "amount": 100},
+        {"account_id": sender_id, "type": "WITHDRAWAL", "amount": 30},
+        {
+            "account_id": sender_id,
+            "type": "TRANSFER",
+            "amount": 50,
+            "receiver_id": receiver_id,
+        },
+    ]:
+        res = await client.post("/api/v1/transactions/", json=payload)
+        assert res.status_code == 201
+
+    # 3. History is newest first, with gap-free seqs and running balances
+    history = (await client.get(f"/api/v1/accounts/{sender_id}/history")).json()
+    assert [e["seq"] for e in history] == [3, 2, 1]
+    assert [float(e["balance_after"]) for e in history] == [20.0, 70.0, 100.0]
+
+    receiver_history = (await client.get(f"/api/v1/accounts/{receiver_id}/history")).json()
+    assert [e["seq"] for e in receiver_history] == [1]
+    assert float(receiver_history[0]["balance_after"]) == 50.0
+
+    # 4. Incremental sync returns only newer entries, oldest first
+    synced = (
+        await client.get(f"/api/v1/accounts/{sender_id}/history", params={"after_seq": 1})
+    ).json()
+    assert [e["seq"] for e in synced] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_bulk_lookup_and_listing(client: AsyncClient):
+    # 1. Create Accounts
+    ids = []
+    for name, currency in [
+        ("Alice", "USD"),
+        ("Alan", "INR"),
+        ("Bob", "USD"),
+        ("Alan", "USD"),
+    ]:
+        res = await client.post("/api/v1/accounts/", json={"name": name, "currency": currency})
+        ids.append(res.json()["id"])
+
+    # 2. Lookup returns known accounts and skips unknown ids
+    missing = "00000000-0000-0000-0000-000000000000"
+    res = await client.post("/api/v1/accounts/lookup", json={"ids": ids[:2] + [missing]})
+    assert res.status_code == 200
+    assert sorted(a["id"] for a in res.json()) == sorted(ids[:2])
+
+    # 3. Filters
+    res = await client.get("/api/v1/accounts/", params={"name_prefix": "Al"})
+    assert sorted(a["name"] for a in res.json()["items"]) == ["Alan", "Alan", "Alice"]
+    res = await client.get("/api/v1/accounts/", params={"currency": "usd"})
+    assert sorted(a["name"] for a in res.json()["items"]) == ["Alan", "Alice", "Bob"]
+
+    # 3b. Prefix pages come in (name, id) order, each match exactly once
+    seen, after = [], None
+    while True:
+        params = {"name_prefix": "Al", "limit": 1}
+        if after:
+            params["after"] = after
+        page = (await client.get("/api/v1/accounts/", params=params)).json()
+        seen += [(a["name"], a["id"]) for a in page["items"]]
+        after = page["next_cursor"]
+        if after is None:
+            break
+    assert seen == sorted((name, id) for name, id in seen)
+    assert sorted(id for _, id in seen) == sorted(ids[:2] + ids[3:])
+
+    res = await client.get(
+        "/api/v1/accounts/", params={"name_prefix": "Al", "after": missing}
+    )
+    assert res.status_code == 400
+
+    # 4. Keyset pagination walks every account exactly once
+    seen, after = [], None
+    while True:
+        params = {"limit": 2}
+        if after:
+            params["after"] = after
+        page = (await client.get("/api/v1/accounts/", params=params)).json()
+        seen += [a["id"] for a in page["items"]]
+        after = page["next_cursor"]
+        if after is None:
+            break
+    assert sorted(seen) == sorted(ids)
+
+
+@pytest.mark.asyncio
+async def test_account_summary(client: AsyncClient):
+    # 1. Create Accounts
+    sender_id = (
+        await client.post("/api/v1/accounts/", json={"name": "Sum Sender", "currency": "USD"})
+    ).json()["id"]
+    receiver_id = (
+        await client.post("/api/v1/accounts/", json={"name": "Sum Receiver", "currency": "USD"})
+    ).json()["id"]
+
+    # 2. Deposit $100 twice, Withdraw $30, Transfer $50
+    for payload in [
+        {"account_id": sender_id, "type": "DEPOSIT", "amount": 100},
+        {"account_id": sender_id, "type": "DEPOSIT", "amount": 100},
+        {"account_id": sender_id, "type": "WITHDRAWAL", "amount": 30},
+        {
+            "account_id": sender_id,
+            "type": "TRANSFER",
+            "amount": 50,
+            "receiver_id": receiver_id,
+        },
+    ]:
+        res = await client.post("/api/v1/transactions/", json=payload)
+        assert res.status_code == 201
+
+    # 3. Everything landed in today's day and month rollups
+    for granularity in ["day", "month"]:
+        res = await client.get(
+            f"/api/v1/accounts/{sender_id}/summary", params={"granularity": granularity}
+        )
+        assert res.status_code == 200
+        periods = res.json()["periods"]
+        assert len(periods) == 1
+        assert float(periods[0]["credits"]) == 200.0
+        assert float(periods[0]["debits"]) == 80.0
+        assert periods[0]["entry_count"] == 4
+        assert float(periods[0]["closing_balance"]) == 120.0
+
+    receiver = (await client.get(f"/api/v1/accounts/{receiver_id}/summary")).json()
+    assert float(receiver["periods"][0]["credits"]) == 50.0
+
+    # 4. Ranges without activity are empty, inverted ranges rejected
+    res = await client.get(
+        f"/api/v1/accounts/{sender_id}/summary",
+        params={"from": "2000-01-01", "to": "2000-12-31"},
+    )
+    assert res.json()["periods"] == []
+    res = await client.get(
+        f"/api/v1/accounts/{sender_id}/summary",
+        params={"from": "2000-12-31", "to": "2000-01-01"},
+    )
+    assert res.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_transaction_search_and_detail(client: AsyncClient):
+    # 1. Create Accounts
+    sender_id = (
+        await client.post("/api/v1/accounts/", json={"name": "Search Sender", "currency": "USD"})
+    ).json()["id"]
+    receiver_id = (
+        await client.post("/api/v1/accounts/", json={"name": "Search Receiver", "currency": "USD"})
+    ).json()["id"]
+
+    # 2. Two invoices, a refund and a transfer
+    tx_ids = []
+    for payload in [
+        {"account_id": sender_id, "type": "DEPOSIT", "amount": 100, "reference": "INV-001"},
+        {"account_id": sender_id, "type": "DEPOSIT", "amount": 50, "reference": "INV-002"},
+        {"account_id": sender_id, "type": "WITHDRAWAL", "amount": 10, "reference": "REF-1"},
+        {
+            "account_id": sender_id,
+            "type": "TRANSFER",
+            "amount": 40,
+            "receiver_id": receiver_id,
+            "reference": "INV_100",
+        },
+    ]:
+        res = await client.post("/api/v1/transactions/", json=payload)
+        assert res.status_code == 201
+        tx_ids.append(res.json()["id"])
+
+    # 3. Filters
+    res = await client.get("/api/v1/transactions/", params={"reference": "INV-002"})
+    assert [t["id"] for t in res.json()["items"]] == [tx_ids[1]]
+    # Newest first; "_" in the prefix is literal, not a LIKE wildcard
+    since = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+    res = await client.get(
+        "/api/v1/transactions/", params={"reference_prefix": "INV-", "from": since}
+    )
+    assert [t["id"] for t in res.json()["items"]] == [tx_ids[1], tx_ids[0]]
+    # Prefix searches must be bounded in time
+    res = await client.get("/api/v1/transactions/", params={"reference_prefix": "INV-"})
+    assert res.status_code == 400
+    res = await client.get(
+        "/api/v1/transactions/",
+        params={"reference_prefix": "INV-", "from": "2000-01-01T00:00:00Z"},
+    )
+    assert res.status_code == 400
+    res = await client.get("/api/v1/transactions/", params={"type": "WITHDRAWAL"})
+    assert [t["id"] for t in res.json()["items"]] == [tx_ids[2]]
+    res = await client.get("/api/v1/transactions/", params={"status": "FAILED"})
+    assert res.json()["items"] == []
+    res = await client.get("/api/v1/transactions/", params={"to": "2000-01-01T00:00:00Z"})
+    assert res.json()["items"] == []
+
+    # 4. Keyset pagination walks every transaction exactly once, newest first
+    seen, after = [], None
+    while True:
+        params = {"limit": 3}
+        if after:
+            params["after"] = after
+        page = (await client.get("/api/v1/transactions/", params=params)).json()
+        seen += [t["id"] for t in page["items"]]
+        after = page["next_cursor"]
+        if after is None:
+            break
+    assert seen == tx_ids[::-1]
+    res = await client.get("/api/v1/transactions/", params={"after": "not-a-cursor"})
+    assert res.status_code == 400
+
+    # 5. Detail includes both legs of the transfer
+    res = await client.get(f"/api/v1/transactions/{tx_ids[3]}")
+    assert res.status_code == 200
+    entries = res.json()["entries"]
+    assert [(e["account_id"], e["direction"], float(e["amount"])) for e in entries] == [
+        (sender_id, "DEBIT", -40.0),
+        (receiver_id, "CREDIT", 40.0),
+    ]
+    res = await client.get("/api/v1/transactions/00000000-0000-0000-0000-000000000000")
+    assert res.status_code == 404